@@ -10,6 +10,30 @@ import os
 from typing import Dict, List, Optional, Any
 
 
+def parallel_requests_from_env(default: int) -> int:
+    """Read the number of requests Ollama runs at once from OLLAMA_NUM_PARALLEL.
+
+    Falls back to the default when the variable is unset, and also, with a
+    warning, when it isn't a whole number of at least 1.
+
+    Args:
+        default: The number of requests to use when OLLAMA_NUM_PARALLEL doesn't set one.
+
+    Returns:
+        The number of requests to keep in flight at once.
+    """
+    value = os.environ.get("OLLAMA_NUM_PARALLEL")
+    if not value:
+        return default
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count < 1:
+        print(f"Warning: Ignoring OLLAMA_NUM_PARALLEL={value!r}, which is not a positive whole number; using {default}")
+        return default
+    return count
+
 @dataclass
 class Config:
     """Configuration settings for ViktorAI.
@@ -23,6 +47,10 @@ class Config:
     model_name: str = "llama3"
     temperature: float = 0.7
     max_tokens: int = 500
+    # Seconds to wait for Ollama's response; None waits as long as it takes
+    read_timeout: Optional[float] = None
+    # How long Ollama keeps the model loaded after a request; None uses Ollama's default
+    keep_alive: Optional[str] = None
 
     # Response classifier settings
     use_response_classifier: bool = False
@@ -81,6 +109,8 @@ class Config:
             "model_name": self.model_name,
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
+            "read_timeout": self.read_timeout,
+            "keep_alive": self.keep_alive,
             "use_response_classifier": self.use_response_classifier,
             "min_response_score": self.min_response_score,
             "debug": self.debug,
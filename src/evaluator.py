@@ -7,104 +7,91 @@ a response captures the Viktor character from Arcane.
 """
 
 import re
+import json
 from typing import Dict, Any, Optional, Union
 
+# orjson is optional; it parses the evaluator's JSON replies faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class Evaluator:
-    """
-    Evaluator class for assessing Viktor character responses.
-    
-    This class encapsulates the logic for evaluating responses to questions
-    about the Viktor character from Arcane. It determines the type of question,
-    constructs an appropriate evaluation prompt, and processes the evaluation
-    results.
-    """
-    
-    def __init__(self, llm_interface):
-        """
-        Initialize the Evaluator with an LLM interface.
-        
-        Args:
-            llm_interface: An interface to an LLM for generating evaluations
-        """
-        self.llm_interface = llm_interface
-    
-    def get_question_type(self, question: str, headings_map: Optional[Dict[str, str]] = None) -> str:
-        """
-        Determine the type of question based on its content.
-        
-        Args:
-            question: The question to categorize
-            headings_map: Optional dictionary mapping questions to their types from file sections
-            
-        Returns:
-            String indicating the question type (identity, technical, relationship, philosophical)
-        """
-        # First check if we have a pre-determined type from the headings map
-        if headings_map and question in headings_map:
-            return headings_map[question]
-        
-        # If not, fallback to the keyword-based approach
-        question_lower = question.lower()
-        
-        # Identity questions
-        if any(keyword in question_lower for keyword in [
-            "who are you", "tell me about yourself", "what's your name", 
-            "introduce yourself", "what's your identity", "who is viktor"
-        ]):
-            return "identity"
-        
-        # Technical questions
-        if any(keyword in question_lower for keyword in [
-            "hexcore", "hextech", "technology", "research", "work", "scientific", 
-            "limitations", "improve", "applications", "experiment", "invention"
-        ]):
-            return "technical"
-        
-        # Relationship questions
-        if any(keyword in question_lower for keyword in [
-            "jayce", "heimerdinger", "sky", "relationship", "friend", "colleague", 
-            "thoughts on", "council", "caitlyn", "silco", "academy"
-        ]):
-            return "relationship"
-        
-        # Philosophical questions
-        if any(keyword in question_lower for keyword in [
-            "evolution", "glorious", "future", "humanity", "progress", "philosophy", 
-            "believe", "think about", "purpose", "divide", "piltover and zaun", 
-            "change one decision", "meaning", "vision", "goal"
-        ]):
-            return "philosophical"
-        
-        # Check for specific questions that might not be caught by the keywords
-        specific_questions = {
-            "how do you feel about your condition?": "identity",
-            "what motivates your scientific work?": "identity",
-            "what happened when sky tried to help you with the hexcore?": "relationship",
-            "how did you feel when jayce presented hextech to the academy?": "relationship",
-            "what was your reaction to being dismissed from the hextech project?": "relationship",
-            "tell me about your disagreement with heimerdinger about progress and hextech.": "relationship",
-            "what happened during your presentation to the council?": "relationship"
-        }
-        
-        if question_lower in specific_questions:
-            return specific_questions[question_lower]
-        
-        # Default to identity if we can't determine the type
-        return "identity"
-    
-    def get_evaluation_criteria(self, question_type: str) -> str:
-        """
-        Get specific evaluation criteria based on the question type.
-        
-        Args:
-            question_type: The type of question (identity, technical, relationship, philosophical)
-            
-        Returns:
-            String containing specific evaluation criteria for this question type
-        """
-        if question_type == "identity":
-            return """
+
+# Keywords used to categorize questions, in the order the types are checked
+QUESTION_TYPE_KEYWORDS = {
+    "identity": [
+        "who are you", "tell me about yourself", "what's your name", 
+        "introduce yourself", "what's your identity", "who is viktor"
+    ],
+    "technical": [
+        "hexcore", "hextech", "technology", "research", "work", "scientific", 
+        "limitations", "improve", "applications", "experiment", "invention"
+    ],
+    "relationship": [
+        "jayce", "heimerdinger", "sky", "relationship", "friend", "colleague", 
+        "thoughts on", "council", "caitlyn", "silco", "academy"
+    ],
+    "philosophical": [
+        "evolution", "glorious", "future", "humanity", "progress", "philosophy", 
+        "believe", "think about", "purpose", "divide", "piltover and zaun", 
+        "change one decision", "meaning", "vision", "goal"
+    ],
+}
+
+# Types for specific questions that might not be caught by the keywords, keyed by lowercased question
+SPECIFIC_QUESTION_TYPES = {
+    "how do you feel about your condition?": "identity",
+    "what motivates your scientific work?": "identity",
+    "what happened when sky tried to help you with the hexcore?": "relationship",
+    "how did you feel when jayce presented hextech to the academy?": "relationship",
+    "what was your reaction to being dismissed from the hextech project?": "relationship",
+    "tell me about your disagreement with heimerdinger about progress and hextech.": "relationship",
+    "what happened during your presentation to the council?": "relationship"
+}
+
+# One compiled alternation per type, so each type is matched in a single scan
+_QUESTION_TYPE_PATTERNS = [
+    (question_type, re.compile("|".join(re.escape(keyword) for keyword in keywords)))
+    for question_type, keywords in QUESTION_TYPE_KEYWORDS.items()
+]
+
+# Labels of the fields in the evaluator's response, mapped to their metric keys
+_EVALUATION_LABELS = {
+    "overall score": "overall_score",
+    "overall reasoning": "overall_reasoning",
+    "primary dimension score": "primary_dimension_score",
+    "primary dimension reasoning": "primary_dimension_reasoning",
+    "character consistency score": "character_consistency_score",
+    "character consistency reasoning": "character_consistency_reasoning"
+}
+
+_SCORE_KEYS = ("overall_score", "primary_dimension_score", "character_consistency_score")
+
+# Reasoning used when the evaluator's response has no reasoning for a score
+_MISSING_REASONING = {
+    "overall_reasoning": "No detailed reasoning was provided by the evaluator for this score. This may indicate that the evaluation was not complete or the response format was unexpected.",
+    "primary_dimension_reasoning": "No detailed reasoning was provided by the evaluator for the primary dimension score. This may indicate an evaluation issue with this response.",
+    "character_consistency_reasoning": "No detailed reasoning was provided by the evaluator for the character consistency score. This suggests an issue with the evaluation format."
+}
+
+# Markdown decoration that may precede a label, such as bold markers, bullets or headings
+_LABEL_DECORATION = " \t*#->`"
+
+# List numbering that may precede a label, such as the "1." in "1. Overall Score: 8"
+_LIST_MARKER_RE = re.compile(r"\d+[.)]\s*")
+
+# A label followed by a colon anywhere in the text, for fields that don't start a line
+_INLINE_LABEL_RE = re.compile(
+    r"(" + "|".join(re.escape(label) for label in _EVALUATION_LABELS) + r")\**\s*:",
+    re.IGNORECASE
+)
+
+# Decoration and list numbering left at the end of a field that precedes an inline label
+_TRAILING_DECORATION_RE = re.compile(r"(?:\s+\d+[.)])?[\s*#>`-]*$")
+
+# Evaluation criteria added to the evaluation prompt for each question type
+EVALUATION_CRITERIA = {
+    "identity": """
             For this identity question, focus on:
             - How well the response captures Viktor's self-perception as a scientist focused on progress
             - Whether it mentions his background from Zaun and work with Hextech
@@ -120,10 +107,8 @@ class Evaluator:
             - Does the response use Viktor's typical speech patterns and technical language?
             - Does it maintain his stoic emotional tone?
             - Is the response consistent with Viktor's known character traits?
-            """
-        
-        elif question_type == "technical":
-            return """
+            """,
+    "technical": """
             For this technical question, focus on:
             - Accuracy and depth of technical details about Hextech/Hexcore
             - Use of precise scientific terminology and concepts
@@ -139,10 +124,8 @@ class Evaluator:
             - Does the response maintain Viktor's methodical approach to technical topics?
             - Does it show appropriate enthusiasm for technological advancement?
             - Does it reflect Viktor's values regarding the purpose of technology?
-            """
-        
-        elif question_type == "relationship":
-            return """
+            """,
+    "relationship": """
             For this relationship question, focus on:
             - How well the response captures Viktor's professional and somewhat detached approach to relationships
             - Whether it emphasizes pragmatic collaboration over emotional connection
@@ -158,10 +141,8 @@ class Evaluator:
             - Does the response maintain Viktor's emotional restraint?
             - Does it use his typical speech patterns when discussing others?
             - Is the level of detail and personal disclosure appropriate for Viktor?
-            """
-        
-        elif question_type == "philosophical":
-            return """
+            """,
+    "philosophical": """
             For this philosophical question, focus on:
             - How well the response captures Viktor's worldview and values
             - Whether it emphasizes progress, evolution, and transcending human limitations
@@ -178,9 +159,10 @@ class Evaluator:
             - Does it use his typical speech patterns and technical framing?
             - Does it show appropriate passion for his vision while maintaining his stoic demeanor?
             """
-        
-        # Default criteria if we can't determine the type
-        return """
+}
+
+# Criteria used when the question type is not recognized
+DEFAULT_EVALUATION_CRITERIA = """
         Focus on how well the response captures Viktor's character overall, including:
         - His identity as a scientist from Zaun
         - His technical knowledge and approach
@@ -196,6 +178,309 @@ class Evaluator:
         - Is the emotional tone consistent with his character?
         - Does the response avoid contradicting established facts about Viktor?
         """
+
+# Static part of the evaluation prompt. The question and response are appended after it,
+# so prompts for the same question type share an identical prefix the LLM backend can reuse
+EVALUATION_PROMPT_TEMPLATE = """You are an expert evaluator assessing how well a response captures the character of Viktor from the Netflix show 'Arcane'. 
+
+### Character Profile: Viktor
+Viktor is a brilliant scientist from Zaun who works with Jayce in Piltover on Hextech technology. He is characterized by:
+- Precise, technical language and methodical thinking
+- Direct, concise communication with minimal emotional expression
+- Focus on scientific progress and overcoming human limitations through technology
+- A pragmatic, solution-oriented mindset
+- Stoic demeanor with occasional dry wit
+- Deep motivation to help others through technological advancement
+- Preference for brevity and efficiency in communication
+
+IMPORTANT: Viktor typically speaks with concision and precision. Verbose, flowery language is NOT characteristic of him. Responses should be brief, direct, and focused.
+
+### Evaluation Task
+You will evaluate the response below on how well it captures Viktor's character, focusing particularly on the following dimensions:
+
+{criteria}
+
+In your evaluation, pay special attention to:
+1. Use of language: Does it match Viktor's precise, technical, and concise manner of speaking?
+2. Content accuracy: Does it align with Viktor's known perspectives and priorities?
+3. Emotional tone: Does it maintain Viktor's characteristic restraint and focus on pragmatic concerns?
+4. BREVITY: Viktor values efficiency in communication. Overly verbose responses should be scored lower unless the verbosity serves a specific purpose aligned with his character.
+
+IMPORTANT: Use the FULL RANGE of scores from 1-10. Do not default to middle scores (5/10) out of uncertainty.
+- If a response is poor, score it between 1-3
+- If a response is below average, score it between 4-5
+- If a response is average, score it between 6-7
+- If a response is good, score it between 8-9
+- If a response is excellent, score it 10
+
+CRITICAL REQUIREMENT: You MUST provide detailed reasoning for EACH score. Explain specifically what works and what doesn't in the response. Your reasoning should reference specific aspects of Viktor's character and specific elements of the response being evaluated.
+
+Format your evaluation as a JSON object with exactly these fields, and nothing else:
+```json
+{{
+  "overall_score": [1-10],
+  "overall_reasoning": "[Your reasoning for the overall score]",
+  "primary_dimension_score": [1-10],
+  "primary_dimension_reasoning": "[Your reasoning for the primary dimension score]",
+  "character_consistency_score": [1-10],
+  "character_consistency_reasoning": "[Your reasoning for the character consistency score]"
+}}
+```
+
+REMEMBER: Be critical and use the full range of scores. Excellent responses should be concise, focused, and authentically capture Viktor's voice. Verbose responses that don't reflect Viktor's efficient communication style should receive lower scores, even if the content is technically accurate.
+"""
+
+# Evaluation prompt prefixes, built once per question type
+_EVALUATION_PROMPT_PREFIXES = {
+    question_type: EVALUATION_PROMPT_TEMPLATE.format(criteria=criteria)
+    for question_type, criteria in EVALUATION_CRITERIA.items()
+}
+_DEFAULT_EVALUATION_PROMPT_PREFIX = EVALUATION_PROMPT_TEMPLATE.format(criteria=DEFAULT_EVALUATION_CRITERIA)
+
+
+def get_evaluation_prompt_prefix(question_type: str) -> str:
+    """
+    Get the part of the evaluation prompt shared by every response of a question type.
+    
+    Args:
+        question_type: Type of question being evaluated
+        
+    Returns:
+        The evaluation instructions and criteria that precede the question and response
+    """
+    return _EVALUATION_PROMPT_PREFIXES.get(question_type, _DEFAULT_EVALUATION_PROMPT_PREFIX)
+
+
+
+def _parse_evaluation_json(evaluation_response: str) -> Optional[Dict[str, str]]:
+    """
+    Read the evaluator's response as the JSON object the prompt asks for.
+    
+    Args:
+        evaluation_response: The raw text returned by the evaluator LLM
+        
+    Returns:
+        Dictionary mapping metric keys to the text of their fields, or None if
+        the response doesn't contain a JSON object with any of the known fields
+    """
+    # Tolerate text or code fences around the object
+    start = evaluation_response.find("{")
+    end = evaluation_response.rfind("}")
+    if start == -1 or end < start:
+        return None
+    
+    try:
+        json_text = evaluation_response[start:end + 1]
+        data = orjson.loads(json_text) if orjson is not None else json.loads(json_text)
+    except ValueError:
+        return None
+    
+    if not isinstance(data, dict):
+        return None
+    
+    fields = {
+        key: str(data[key]).strip()
+        for key in _EVALUATION_LABELS.values()
+        if data.get(key) is not None
+    }
+    return fields or None
+
+
+def _parse_evaluation_fields(evaluation_response: str) -> Dict[str, str]:
+    """
+    Split the evaluator's response into its labelled fields in a single pass.
+    
+    A line starting with one of the known labels (optionally decorated with
+    markdown or list numbering) starts a field. Reasoning continues on the
+    following lines until a blank line or the next label; a score whose label
+    line has no value is taken from the next non-blank line. Only the first
+    occurrence of each label is kept. A field also ends where another label
+    appears inside it, and labels that don't start a line are picked up by
+    _parse_inline_fields.
+    
+    Args:
+        evaluation_response: The raw text returned by the evaluator LLM
+        
+    Returns:
+        Dictionary mapping metric keys to the raw text of their fields
+    """
+    fields = {}
+    current_key = None
+    
+    for line in evaluation_response.splitlines():
+        stripped = line.strip()
+        label_line = stripped.lstrip(_LABEL_DECORATION)
+        list_marker = _LIST_MARKER_RE.match(label_line)
+        if list_marker:
+            label_line = label_line[list_marker.end():].lstrip(_LABEL_DECORATION)
+        label_text = label_line.lower()
+        
+        # Check whether the line starts a new field
+        key = None
+        for label, label_key in _EVALUATION_LABELS.items():
+            if label_text.startswith(label):
+                key = label_key
+                value = label_line[len(label):]
+                break
+        
+        if key is not None:
+            if key in fields:
+                # A repeated label ends the current field without replacing the first one
+                current_key = None
+                continue
+            fields[key] = value.lstrip("*:").strip()
+            current_key = key
+            continue
+        
+        if current_key is None:
+            continue
+        
+        if not stripped:
+            # A blank line ends a field, unless its value hasn't started yet
+            if fields[current_key]:
+                current_key = None
+            continue
+        
+        if current_key in _SCORE_KEYS:
+            if not fields[current_key]:
+                fields[current_key] = stripped
+            current_key = None
+        else:
+            fields[current_key] = f"{fields[current_key]}\n{stripped}" if fields[current_key] else stripped
+    
+    # End fields at any label inside them, as in "Overall Reasoning: ... Primary Dimension Score: 7"
+    for key, value in fields.items():
+        inline_label = _INLINE_LABEL_RE.search(value)
+        if inline_label:
+            fields[key] = _TRAILING_DECORATION_RE.sub("", value[:inline_label.start()])
+    
+    if len(fields) < len(_EVALUATION_LABELS):
+        _parse_inline_fields(evaluation_response, fields)
+    
+    return fields
+
+
+def _parse_inline_fields(evaluation_response: str, fields: Dict[str, str]) -> None:
+    """
+    Add the fields whose labels appear anywhere in the text, not only at the start of a line.
+    
+    Handles evaluators that run the fields together, as in "Overall Score: 8.
+    Overall Reasoning: ... Primary Dimension Score: 7". A field runs from its
+    label to the next label or blank line. Fields already in fields are kept.
+    
+    Args:
+        evaluation_response: The raw text returned by the evaluator LLM
+        fields: Dictionary mapping metric keys to the raw text of their fields,
+            updated in place
+    """
+    matches = list(_INLINE_LABEL_RE.finditer(evaluation_response))
+    for match, next_match in zip(matches, matches[1:] + [None]):
+        key = _EVALUATION_LABELS[match.group(1).lower()]
+        if key in fields:
+            continue
+        end = next_match.start() if next_match else len(evaluation_response)
+        value = evaluation_response[match.end():end].strip().split("\n\n", 1)[0]
+        value = _TRAILING_DECORATION_RE.sub("", value).lstrip("*").strip()
+        if value:
+            fields[key] = value
+
+
+def _parse_score(value: Optional[str]) -> Optional[float]:
+    """
+    Read the number at the start of a score field, such as the 8 in "8/10".
+    
+    Args:
+        value: Raw text of the score field, or None if the field was missing
+        
+    Returns:
+        The score as a float, or None if the field doesn't start with a number
+    """
+    if not value:
+        return None
+    
+    value = value.lstrip("*[ ")
+    end = 0
+    while end < len(value) and value[end].isdigit():
+        end += 1
+    if end == 0:
+        return None
+    
+    # Include a fractional part, as in "7.5"
+    if end + 1 < len(value) and value[end] == "." and value[end + 1].isdigit():
+        end += 2
+        while end < len(value) and value[end].isdigit():
+            end += 1
+    
+    return float(value[:end])
+
+
+class Evaluator:
+    """
+    Evaluator class for assessing Viktor character responses.
+    
+    This class encapsulates the logic for evaluating responses to questions
+    about the Viktor character from Arcane. It determines the type of question,
+    constructs an appropriate evaluation prompt, and processes the evaluation
+    results.
+    """
+    
+    def __init__(self, llm_interface):
+        """
+        Initialize the Evaluator with an LLM interface.
+        
+        Args:
+            llm_interface: An interface to an LLM for generating evaluations
+        """
+        self.llm_interface = llm_interface
+    
+    def get_question_type(
+        self, 
+        question: str, 
+        headings_map: Optional[Dict[str, str]] = None, 
+        question_lower: Optional[str] = None
+    ) -> str:
+        """
+        Determine the type of question based on its content.
+        
+        Args:
+            question: The question to categorize
+            headings_map: Optional dictionary mapping questions to their types from file sections
+            question_lower: Optional, the question already lowercased by the caller
+            
+        Returns:
+            String indicating the question type (identity, technical, relationship, philosophical)
+        """
+        # First check if we have a pre-determined type from the headings map
+        if headings_map and question in headings_map:
+            return headings_map[question]
+        
+        # If not, fallback to the keyword-based approach
+        if question_lower is None:
+            question_lower = question.lower()
+        
+        # Types are checked in priority order; the first one with a matching keyword wins
+        for question_type, pattern in _QUESTION_TYPE_PATTERNS:
+            if pattern.search(question_lower):
+                return question_type
+        
+        # Check for specific questions that might not be caught by the keywords
+        if question_lower in SPECIFIC_QUESTION_TYPES:
+            return SPECIFIC_QUESTION_TYPES[question_lower]
+        
+        # Default to identity if we can't determine the type
+        return "identity"
+    
+    def get_evaluation_criteria(self, question_type: str) -> str:
+        """
+        Get specific evaluation criteria based on the question type.
+        
+        Args:
+            question_type: The type of question (identity, technical, relationship, philosophical)
+            
+        Returns:
+            String containing specific evaluation criteria for this question type
+        """
+        return EVALUATION_CRITERIA.get(question_type, DEFAULT_EVALUATION_CRITERIA)
     
     def calculate_weighted_score(self, metrics: Dict[str, Any]) -> float:
         """
@@ -252,63 +537,14 @@ class Evaluator:
         if question_type is None:
             question_type = self.get_question_type(question, headings_map)
         
-        # Get evaluation criteria for this question type
-        criteria = self.get_evaluation_criteria(question_type)
-        
-        # Construct the evaluation prompt
-        evaluation_prompt = f"""You are an expert evaluator assessing how well a response captures the character of Viktor from the Netflix show 'Arcane'. 
-
-### Character Profile: Viktor
-Viktor is a brilliant scientist from Zaun who works with Jayce in Piltover on Hextech technology. He is characterized by:
-- Precise, technical language and methodical thinking
-- Direct, concise communication with minimal emotional expression
-- Focus on scientific progress and overcoming human limitations through technology
-- A pragmatic, solution-oriented mindset
-- Stoic demeanor with occasional dry wit
-- Deep motivation to help others through technological advancement
-- Preference for brevity and efficiency in communication
-
-IMPORTANT: Viktor typically speaks with concision and precision. Verbose, flowery language is NOT characteristic of him. Responses should be brief, direct, and focused.
-
+        # Construct the evaluation prompt, keeping the per-call content at the end
+        prompt_prefix = get_evaluation_prompt_prefix(question_type)
+        evaluation_prompt = f"""{prompt_prefix}
 ### Question
 {question}
 
 ### Response to Evaluate
 {response}
-
-### Evaluation Task
-You will evaluate this response on how well it captures Viktor's character, focusing particularly on the following dimensions:
-
-{criteria}
-
-In your evaluation, pay special attention to:
-1. Use of language: Does it match Viktor's precise, technical, and concise manner of speaking?
-2. Content accuracy: Does it align with Viktor's known perspectives and priorities?
-3. Emotional tone: Does it maintain Viktor's characteristic restraint and focus on pragmatic concerns?
-4. BREVITY: Viktor values efficiency in communication. Overly verbose responses should be scored lower unless the verbosity serves a specific purpose aligned with his character.
-
-IMPORTANT: Use the FULL RANGE of scores from 1-10. Do not default to middle scores (5/10) out of uncertainty.
-- If a response is poor, score it between 1-3
-- If a response is below average, score it between 4-5
-- If a response is average, score it between 6-7
-- If a response is good, score it between 8-9
-- If a response is excellent, score it 10
-
-CRITICAL REQUIREMENT: You MUST provide detailed reasoning for EACH score. Explain specifically what works and what doesn't in the response. Your reasoning should reference specific aspects of Viktor's character and specific elements of the response being evaluated.
-
-Format your evaluation as follows:
-```
-Overall Score: [1-10]
-Overall Reasoning: [Your reasoning for the overall score]
-
-Primary Dimension Score: [1-10]
-Primary Dimension Reasoning: [Your reasoning for the primary dimension score]
-
-Character Consistency Score: [1-10]
-Character Consistency Reasoning: [Your reasoning for the character consistency score]
-```
-
-REMEMBER: Be critical and use the full range of scores. Excellent responses should be concise, focused, and authentically capture Viktor's voice. Verbose responses that don't reflect Viktor's efficient communication style should receive lower scores, even if the content is technically accurate.
 """
         
         try:
@@ -316,83 +552,33 @@ REMEMBER: Be critical and use the full range of scores. Excellent responses shou
             evaluation_response = self.llm_interface.generate(evaluation_prompt)
             
             # Parse the evaluation response
+            fields = _parse_evaluation_json(evaluation_response)
+            if fields is None:
+                # Fall back to the labelled text format for evaluators that ignore the JSON request
+                fields = _parse_evaluation_fields(evaluation_response)
             metrics = {}
             
-            # Extract overall score - improved regex to handle more formats
-            overall_match = re.search(r'Overall Score:\s*(\d+(?:\.\d+)?|[0-9]+)', evaluation_response, re.IGNORECASE)
-            if overall_match:
-                try:
-                    metrics["overall_score"] = float(overall_match.group(1))
-                except ValueError:
-                    print(f"Warning: Could not convert overall score '{overall_match.group(1)}' to float")
-                    metrics["overall_score"] = 5.0  # Default fallback value
-            else:
-                print("Warning: Could not extract overall score from evaluation response")
-                metrics["overall_score"] = 5.0  # Default fallback value
-            
-            # Extract overall reasoning - improved regex to handle more formats
-            overall_reasoning_match = re.search(r'Overall Reasoning:?\s*(.*?)(?=\n\n|\n[A-Z]|Primary Dimension Score|$)', 
-                                                evaluation_response, re.DOTALL | re.IGNORECASE)
-            if overall_reasoning_match:
-                metrics["overall_reasoning"] = overall_reasoning_match.group(1).strip()
-            else:
-                metrics["overall_reasoning"] = "No detailed reasoning was provided by the evaluator for this score. This may indicate that the evaluation was not complete or the response format was unexpected."
-            
-            # Extract primary dimension score - improved regex to handle more formats
-            primary_match = re.search(r'Primary Dimension Score:?\s*(\d+(?:\.\d+)?|[0-9]+)', 
-                                      evaluation_response, re.IGNORECASE)
-            if primary_match:
-                try:
-                    metrics["primary_dimension_score"] = float(primary_match.group(1))
-                except ValueError:
-                    print(f"Warning: Could not convert primary dimension score '{primary_match.group(1)}' to float")
-                    metrics["primary_dimension_score"] = 5.0  # Default fallback value
-            else:
-                print("Warning: Could not extract primary dimension score from evaluation response")
-                metrics["primary_dimension_score"] = 5.0  # Default fallback value
-            
-            # Extract primary dimension reasoning - improved regex to handle more formats
-            primary_reasoning_match = re.search(r'Primary Dimension Reasoning:?\s*(.*?)(?=\n\n|\n[A-Z]|Character Consistency Score|$)', 
-                                                evaluation_response, re.DOTALL | re.IGNORECASE)
-            if primary_reasoning_match:
-                metrics["primary_dimension_reasoning"] = primary_reasoning_match.group(1).strip()
-            else:
-                metrics["primary_dimension_reasoning"] = "No detailed reasoning was provided by the evaluator for the primary dimension score. This may indicate an evaluation issue with this response."
-            
-            # Extract character consistency score - improved regex to handle more formats
-            consistency_match = re.search(r'Character Consistency Score:?\s*(\d+(?:\.\d+)?|[0-9]+)', 
-                                          evaluation_response, re.IGNORECASE)
-            if consistency_match:
-                try:
-                    metrics["character_consistency_score"] = float(consistency_match.group(1))
-                except ValueError:
-                    print(f"Warning: Could not convert character consistency score '{consistency_match.group(1)}' to float")
-                    metrics["character_consistency_score"] = 5.0  # Default fallback value
-            else:
-                print("Warning: Could not extract character consistency score from evaluation response")
-                metrics["character_consistency_score"] = 5.0  # Default fallback value
-            
-            # Extract character consistency reasoning - improved regex to handle more formats
-            consistency_reasoning_match = re.search(r'Character Consistency Reasoning:?\s*(.*?)(?=\n\n|\n[A-Z]|$)', 
-                                                    evaluation_response, re.DOTALL | re.IGNORECASE)
-            if consistency_reasoning_match:
-                metrics["character_consistency_reasoning"] = consistency_reasoning_match.group(1).strip()
-            else:
-                metrics["character_consistency_reasoning"] = "No detailed reasoning was provided by the evaluator for the character consistency score. This suggests an issue with the evaluation format."
+            for key in _EVALUATION_LABELS.values():
+                if key in _SCORE_KEYS:
+                    score = _parse_score(fields.get(key))
+                    if score is None:
+                        print(f"Warning: Could not extract {key.replace('_', ' ')} from evaluation response")
+                        score = 5.0  # Default fallback value
+                    metrics[key] = score
+                else:
+                    metrics[key] = fields.get(key, _MISSING_REASONING[key])
             
             # Add question type to metrics
             metrics["question_type"] = question_type
             
-            # Clean up the reasoning text by removing any ** markers or other formatting
-            for key in metrics:
-                if isinstance(metrics[key], str):
-                    # Remove ** markers
-                    metrics[key] = re.sub(r'\*\*\s*', '', metrics[key])
-                    metrics[key] = re.sub(r'\s*\*\*', '', metrics[key])
-                    # Remove markdown backticks
-                    metrics[key] = re.sub(r'```', '', metrics[key])
-                    # Trim any extra whitespace
-                    metrics[key] = metrics[key].strip()
+            # Clean up the reasoning text by removing any ** markers or other formatting.
+            # The parsed fields are already trimmed, so this is only needed when the raw
+            # response contains markers at all
+            if '**' in evaluation_response or '```' in evaluation_response:
+                for key in metrics:
+                    if isinstance(metrics[key], str):
+                        # Remove ** markers and markdown backticks, then trim any extra whitespace
+                        metrics[key] = metrics[key].replace('**', '').replace('```', '').strip()
             
             # Additional validation for scores
             for score_key in ["overall_score", "primary_dimension_score", "character_consistency_score"]:
@@ -403,6 +589,9 @@ REMEMBER: Be critical and use the full range of scores. Excellent responses shou
                     elif metrics[score_key] > 10:
                         metrics[score_key] = 10.0
             
+            # Store the weighted score so reports don't need to recompute it
+            metrics["weighted_score"] = self.calculate_weighted_score(metrics)
+            
             return metrics
         
         except Exception as e:
@@ -415,7 +604,9 @@ REMEMBER: Be critical and use the full range of scores. Excellent responses shou
                 "primary_dimension_reasoning": "This is a default fallback score. The primary dimension evaluation couldn't be completed due to an error in the evaluation process.",
                 "character_consistency_score": 5.0,  # Default middle score
                 "character_consistency_reasoning": "This is a default fallback score. The character consistency evaluation couldn't be completed due to an error in the evaluation process.",
-                "question_type": question_type
+                "question_type": question_type,
+                "weighted_score": 5.0,  # Weighted score of the default middle scores
+                "errored": True
             }
     
     def format_evaluation_output(
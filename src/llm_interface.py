@@ -6,8 +6,24 @@ and receiving responses.
 """
 
 import json
+import time
+import threading
 import requests
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+
+# Seconds to wait for a connection to Ollama
+CONNECT_TIMEOUT = 10
+
+# Attempts made for a request that fails to reach Ollama
+MAX_ATTEMPTS = 3
+
+# Delay before the first retry, doubled after every further failed attempt
+RETRY_BACKOFF = 0.5
+
+# Failures to reach Ollama, including connect timeouts. Read timeouts and
+# connections dropped mid-response aren't retried, as Ollama may still be
+# generating and a retry would queue the same generation again.
+_RETRY_ERRORS = (requests.exceptions.ConnectionError,)
 
 class OllamaInterface:
     """Interface for interacting with Ollama LLMs."""
@@ -22,6 +38,82 @@ class OllamaInterface:
         # Use localhost when running locally
         self.api_base = "http://localhost:11434/api"
         self.history = []
+        
+        # requests.Session isn't documented as thread-safe, so each thread gets its own
+        self._local = threading.local()
+    
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session, reused so its requests share kept-alive connections."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({"Content-Type": "application/json"})
+            self._local.session = session
+        return session
+    
+    @property
+    def timeout(self) -> Tuple[float, Optional[float]]:
+        """The (connect, read) timeout for requests to Ollama.
+        
+        The read timeout comes from the config's read_timeout; by default
+        there is none, as long generations on slow hardware can take minutes.
+        """
+        return (CONNECT_TIMEOUT, getattr(self.config, "read_timeout", None))
+    
+    def _send(self, endpoint: str, payload: Dict[str, Any]) -> requests.Response:
+        """Send a request to the Ollama API and return the response once its headers arrive.
+        
+        Failures to reach Ollama are retried with exponential backoff; any other
+        failure (such as a read timeout) is raised at once. The body is streamed,
+        so reading it is left to the caller and is never retried. The config's
+        keep_alive, if set, is sent with every request.
+        
+        Args:
+            endpoint: The API endpoint, relative to the API base URL.
+            payload: The JSON payload to send.
+            
+        Returns:
+            The response, with its body not yet read.
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        keep_alive = getattr(self.config, "keep_alive", None)
+        if keep_alive is not None:
+            payload = {**payload, "keep_alive": keep_alive}
+        
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                return self.session.post(
+                    f"{self.api_base}/{endpoint}",
+                    json=payload,
+                    timeout=self.timeout,
+                    stream=True
+                )
+            except _RETRY_ERRORS:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(RETRY_BACKOFF * 2 ** attempt)
+    
+    def _post(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request to the Ollama API and return the decoded response.
+        
+        Args:
+            endpoint: The API endpoint, relative to the API base URL.
+            payload: The JSON payload to send.
+            
+        Returns:
+            The decoded JSON response.
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        with self._send(endpoint, payload) as response:
+            # Check for errors
+            response.raise_for_status()
+            
+            return response.json()
     
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate a response from the LLM.
@@ -51,17 +143,7 @@ class OllamaInterface:
         
         try:
             # Send the request to Ollama
-            response = requests.post(
-                f"{self.api_base}/generate",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            # Check for errors
-            response.raise_for_status()
-            
-            # Parse the response
-            result = response.json()
+            result = self._post("generate", payload)
             
             # Update history
             self.history.append({"role": "user", "content": prompt})
@@ -72,6 +154,59 @@ class OllamaInterface:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Error communicating with Ollama: {e}")
     
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Generate a response from the LLM, yielding it piece by piece as it is produced.
+        
+        Args:
+            prompt: The user prompt to send to the LLM.
+            system_prompt: Optional system prompt to provide context.
+            
+        Failures to reach Ollama are retried like in _send; once the response
+        has started, any failure is raised.
+        
+        Yields:
+            Consecutive pieces of the generated response.
+            
+        Raises:
+            Exception: If there is an error communicating with the LLM.
+        """
+        # Prepare the request payload
+        payload = {
+            "model": self.config.model_name,
+            "prompt": prompt,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "stream": True,
+        }
+        
+        # Add system prompt if provided
+        if system_prompt:
+            payload["system"] = system_prompt
+        
+        pieces = []
+        try:
+            # Ollama streams one JSON object per line until it reports it is done
+            with self._send("generate", payload) as response:
+                response.raise_for_status()
+                # chunk_size=None hands over each line as soon as it arrives
+                for line in response.iter_lines(chunk_size=None):
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    piece = chunk.get("response", "")
+                    if piece:
+                        pieces.append(piece)
+                        yield piece
+                    if chunk.get("done"):
+                        break
+            
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Error communicating with Ollama: {e}")
+        
+        # Update history
+        self.history.append({"role": "user", "content": prompt})
+        self.history.append({"role": "assistant", "content": "".join(pieces)})
+    
     def generate_with_chat_history(self, 
                                   messages: List[Dict[str, str]], 
                                   system_prompt: Optional[str] = None) -> str:
@@ -102,17 +237,7 @@ class OllamaInterface:
         
         try:
             # Send the request to Ollama
-            response = requests.post(
-                f"{self.api_base}/chat",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            # Check for errors
-            response.raise_for_status()
-            
-            # Parse the response
-            result = response.json()
+            result = self._post("chat", payload)
             
             # Update history with the new message
             self.history = messages.copy()
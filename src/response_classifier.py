@@ -68,7 +68,7 @@ class ResponseClassifier:
         self.model.eval()
 
         # Generate evaluation scores
-        with torch.no_grad():
+        with torch.inference_mode():
             character_score, quality_score = self.model(features)
 
         return {
@@ -77,6 +77,55 @@ class ResponseClassifier:
             "overall_score": float((character_score + quality_score) / 2),
         }
 
+    def evaluate_batch(
+        self, prompts: List[str], responses: List[str]
+    ) -> List[Dict[str, float]]:
+        """Evaluate several responses with a single forward pass.
+
+        Args:
+            prompts: The user prompts.
+            responses: The generated responses to evaluate, one per prompt.
+
+        Returns:
+            List of evaluation score dictionaries, in the order of the inputs.
+        """
+        if len(prompts) != len(responses):
+            raise ValueError("prompts and responses must have the same length")
+        if not prompts:
+            return []
+
+        # Stack the features of every pair into one [batch, features] tensor
+        features = torch.stack(
+            [
+                self._prepare_features(prompt, response)
+                for prompt, response in zip(prompts, responses)
+            ]
+        )
+
+        # Set model to evaluation mode
+        self.model.eval()
+
+        # Generate evaluation scores
+        with torch.inference_mode():
+            character_scores, quality_scores = self.model(features)
+            # The model squeezes its outputs, so a batch of one comes back as a scalar
+            character_scores = character_scores.reshape(-1)
+            quality_scores = quality_scores.reshape(-1)
+            overall_scores = (character_scores + quality_scores) / 2
+
+        return [
+            {
+                "character_accuracy": character_score,
+                "response_quality": quality_score,
+                "overall_score": overall_score,
+            }
+            for character_score, quality_score, overall_score in zip(
+                character_scores.tolist(),
+                quality_scores.tolist(),
+                overall_scores.tolist(),
+            )
+        ]
+
     def _prepare_features(self, prompt: str, response: str) -> torch.Tensor:
         """Prepare input features for the model.
 
@@ -195,22 +244,25 @@ def train_model(
     criterion = nn.MSELoss()
     optimizer = torch.optim.Adam(classifier.model.parameters(), lr=learning_rate)
 
+    # Prepare features and targets once, since they are the same every epoch
+    samples = [
+        (
+            classifier._prepare_features(sample["prompt"], sample["response"]),
+            torch.tensor(
+                sample["character_score"], dtype=torch.float32, device=classifier.device
+            ),
+            torch.tensor(
+                sample["quality_score"], dtype=torch.float32, device=classifier.device
+            ),
+        )
+        for sample in training_data
+    ]
+
     # Training loop
     for epoch in range(epochs):
         total_loss = 0
 
-        for sample in training_data:
-            # Prepare features and targets
-            features = classifier._prepare_features(
-                sample["prompt"], sample["response"]
-            )
-            character_target = torch.tensor(
-                sample["character_score"], dtype=torch.float32, device=classifier.device
-            )
-            quality_target = torch.tensor(
-                sample["quality_score"], dtype=torch.float32, device=classifier.device
-            )
-
+        for features, character_target, quality_target in samples:
             # Zero gradients
             optimizer.zero_grad()
 
@@ -10,17 +10,51 @@ allowing quick iteration on the evaluation logic.
 import os
 import sys
 import json
+import hashlib
 import argparse
+import functools
 from pathlib import Path
 import re
+import shutil
+import threading
 from datetime import datetime
+from html import escape
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 
-# Add the parent directory to the path so we can import the src modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# When run as a plain script, add the parent directory to the path so we can import
+# the src modules; under pytest or `python -m tests.test_evaluator` it is already there
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.config import Config
-from src.llm_interface import OllamaInterface
-from src.evaluator import Evaluator  # Import the new Evaluator class
+from src.config import Config, parallel_requests_from_env
+from src.evaluator import Evaluator, EVALUATION_PROMPT_TEMPLATE, get_evaluation_prompt_prefix  # Import the new Evaluator class
+
+# orjson is optional; it parses the mock evaluation data and writes the results faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The Ollama interface needs the HTTP client dependencies; the mock works without them
+try:
+    from src.llm_interface import OllamaInterface
+except ImportError:
+    OllamaInterface = None
+
+# Maximum number of evaluator LLM calls kept in flight at once, unless Ollama's
+# OLLAMA_NUM_PARALLEL says how many requests it runs at once
+MAX_EVALUATOR_WORKERS = 8
+
+# Name of the directory in the output directory that caches evaluator LLM responses
+LLM_CACHE_DIRNAME = ".llm_cache"
+
+# Part of every LLM cache key; bump it to invalidate all cached evaluator responses
+CACHE_VERSION = 1
+
+# Name of the on-disk semantic evaluation cache kept in the output directory
+SEMANTIC_CACHE_FILENAME = ".semantic_eval_cache.npz"
 
 # Sample responses for testing the evaluator
 SAMPLE_RESPONSES = {
@@ -118,27 +152,133 @@ Join me, and together we will create a new world order! The glorious evolution w
     }
 }
 
-# Create separate sample variables for easier access
-IDENTITY_SAMPLES = [
-    {"question": SAMPLE_RESPONSES["identity"]["question"], "response": resp}
-    for resp in SAMPLE_RESPONSES["identity"]["responses"]
-]
+# Module attributes that expose the sample list for one question type
+SAMPLE_SET_NAMES = {
+    "IDENTITY_SAMPLES": "identity",
+    "TECHNICAL_SAMPLES": "technical",
+    "RELATIONSHIP_SAMPLES": "relationship",
+    "PHILOSOPHICAL_SAMPLES": "philosophical"
+}
 
-TECHNICAL_SAMPLES = [
-    {"question": SAMPLE_RESPONSES["technical"]["question"], "response": resp}
-    for resp in SAMPLE_RESPONSES["technical"]["responses"]
-]
+@functools.lru_cache(maxsize=None)
+def get_samples(question_type):
+    """
+    Get the question/response samples for a question type, building them on first use.
+    
+    Args:
+        question_type: The type of question (identity, technical, relationship, philosophical)
+        
+    Returns:
+        List of dictionaries with "question" and "response" keys
+    """
+    samples = SAMPLE_RESPONSES[question_type]
+    return [{"question": samples["question"], "response": resp} for resp in samples["responses"]]
 
-RELATIONSHIP_SAMPLES = [
-    {"question": SAMPLE_RESPONSES["relationship"]["question"], "response": resp}
-    for resp in SAMPLE_RESPONSES["relationship"]["responses"]
-]
+def __getattr__(name):
+    """Build IDENTITY_SAMPLES and the other per-type sample lists only when accessed."""
+    if name in SAMPLE_SET_NAMES:
+        return get_samples(SAMPLE_SET_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Layout of the evaluations the mock returns for sample responses
+_MOCK_EVALUATION_TEMPLATE = """```
+Overall Score: {overall_score}
+Overall Reasoning: {overall_reasoning}
+
+Primary Dimension Score: {primary_dimension_score}
+Primary Dimension Reasoning: {primary_dimension_reasoning}
+
+Character Consistency Score: {character_consistency_score}
+Character Consistency Reasoning: {character_consistency_reasoning}
+```"""
+
+# Scores and reasoning the mock fills into the template, by question type, for the
+# good, medium and poor samples in that order
+MOCK_EVALUATIONS_FILE = Path(__file__).parent / "mock_evaluations.json"
+
+# Evaluations the mock returns when it is given an evaluation prompt, by simulated quality
+_MOCK_QUALITY_EVALUATIONS = {
+    "high": {
+        "overall_score": 9.0,
+        "overall_reasoning": "This response effectively captures Viktor's character with precise, technical language and stoic tone.",
+        "primary_dimension_score": 9.0,
+        "primary_dimension_reasoning": "The response demonstrates excellent understanding of Viktor's personality and priorities.",
+        "character_consistency_score": 8.0,
+        "character_consistency_reasoning": "The response maintains Viktor's typical speech patterns and emotional restraint."
+    },
+    "medium": {
+        "overall_score": 6.0,
+        "overall_reasoning": "This response adequately captures Viktor's character but lacks some nuance.",
+        "primary_dimension_score": 7.0,
+        "primary_dimension_reasoning": "The response shows understanding of Viktor's core traits but could be more precise.",
+        "character_consistency_score": 6.0,
+        "character_consistency_reasoning": "The response generally maintains Viktor's speech patterns with some inconsistencies."
+    },
+    "low": {
+        "overall_score": 3.0,
+        "overall_reasoning": "This response fails to capture Viktor's character in several key ways.",
+        "primary_dimension_score": 2.0,
+        "primary_dimension_reasoning": "The response misrepresents Viktor's core traits and priorities.",
+        "character_consistency_score": 3.0,
+        "character_consistency_reasoning": "The response does not maintain Viktor's typical speech patterns or emotional tone."
+    }
+}
+
+# The same evaluations serialized once, since the mock only ever returns these three strings
+_MOCK_QUALITY_EVALUATION_JSON = {
+    quality: json.dumps(evaluation, indent=2)
+    for quality, evaluation in _MOCK_QUALITY_EVALUATIONS.items()
+}
 
-PHILOSOPHICAL_SAMPLES = [
-    {"question": SAMPLE_RESPONSES["philosophical"]["question"], "response": resp}
-    for resp in SAMPLE_RESPONSES["philosophical"]["responses"]
+# Opening line of the Evaluator's prompt, which tells the mock it is asked for an evaluation
+_EVALUATION_PROMPT_MARKER = EVALUATION_PROMPT_TEMPLATE.split("\n", 1)[0].strip()
+
+# Pattern the mock uses to pull the question and response out of evaluation prompts
+_QUESTION_RESPONSE_RE = re.compile(
+    r'### Question\n(?P<question>.*?)\n\n### Response to Evaluate\n(?P<response>.*)',
+    re.DOTALL
+)
+
+# Question types the mock answers for, checked in order when a prompt mentions several
+_MOCK_QUESTION_TYPES = ("identity", "technical", "relationship", "philosophical")
+_MOCK_QUESTION_TYPE_RE = re.compile("|".join(_MOCK_QUESTION_TYPES), re.IGNORECASE)
+
+# Words that set the quality the mock simulates, checked in order; "low" wins over "high"
+_QUALITY_PATTERNS = [
+    ("low", re.compile(r'poor|unknown', re.IGNORECASE)),
+    ("high", re.compile(r'good|optimal', re.IGNORECASE))
 ]
 
+@functools.lru_cache(maxsize=None)
+def load_mock_responses():
+    """
+    Load the mock's canned evaluations, formatted as evaluator responses.
+    
+    Returns:
+        Read-only mapping of question type to a tuple of response strings
+    """
+    data = MOCK_EVALUATIONS_FILE.read_bytes()
+    mock_evaluations = orjson.loads(data) if orjson is not None else json.loads(data)
+    return MappingProxyType({
+        question_type: tuple(_MOCK_EVALUATION_TEMPLATE.format_map(evaluation) for evaluation in evaluations)
+        for question_type, evaluations in mock_evaluations.items()
+    })
+
+@functools.lru_cache(maxsize=None)
+def _sample_positions():
+    """
+    Map each sample question and response to the response's place among the samples.
+    
+    Returns:
+        Read-only mapping of (question, response) to (question type, index in
+        that type's responses), both stripped of surrounding whitespace
+    """
+    return MappingProxyType({
+        (samples["question"].strip(), response.strip()): (question_type, index)
+        for question_type, samples in SAMPLE_RESPONSES.items()
+        for index, response in enumerate(samples["responses"])
+    })
+
 class MockOllamaInterface:
     """Mock implementation of OllamaInterface for testing without a running Ollama server."""
     
@@ -148,235 +288,46 @@ class MockOllamaInterface:
         self.history = []
         self.response_index = 0
         self.question_type = None
-        
-        # Define responses by question type for more realistic variation
-        self.mock_responses = {
-            "identity": [
-                # Good response (high scores)
-                """```
-Overall Score: 8
-Overall Reasoning: This response effectively captures Viktor's character with concise, direct language. The brevity and focus on his scientific role align well with his character's straightforward communication style.
-
-Primary Dimension Score: 9
-Primary Dimension Reasoning: The response excellently addresses the identity question, providing key information about who Viktor is in a succinct manner that matches his character's preference for efficiency.
-
-Character Consistency Score: 7
-Character Consistency Reasoning: The response maintains good consistency with Viktor's established character traits, though could include a hint of his focus on technological advancement to fully capture his perspective.
-```""",
-                # Medium response (average scores)
-                """```
-Overall Score: 6
-Overall Reasoning: This response adequately captures some aspects of Viktor's character but lacks depth. It presents basic information about him without fully conveying his scientific focus and pragmatic attitude.
-
-Primary Dimension Score: 5
-Primary Dimension Reasoning: The response addresses the basic elements of the identity question but lacks the precision that would make it truly representative of Viktor's character.
-
-Character Consistency Score: 7
-Character Consistency Reasoning: The character consistency is acceptable, with appropriate directness in speech, though it doesn't fully capture Viktor's scientific focus and drive.
-```""",
-                # Poor response (low scores)
-                """```
-Overall Score: 2
-Overall Reasoning: This response fundamentally misrepresents Viktor's character with flowery, philosophical language that contradicts his established traits. Viktor is direct and precise, not mysterious or verbose.
-
-Primary Dimension Score: 3
-Primary Dimension Reasoning: The response fails to address the identity question appropriately, portraying Viktor in ways completely inconsistent with his character.
-
-Character Consistency Score: 1
-Character Consistency Reasoning: The response is entirely inconsistent with Viktor's established speech patterns and personality, using emotional and dramatic language that Viktor would never employ.
-```"""
-            ],
-            "technical": [
-                # Good response (high scores)
-                """```
-Overall Score: 9
-Overall Reasoning: This response effectively captures Viktor's technical knowledge with precise, concise language focused on practical applications. The measured tone and recognition of both potential and danger align perfectly with his character.
-
-Primary Dimension Score: 8
-Primary Dimension Reasoning: The response excels at addressing the technical question, providing key information about the Hexcore in a direct manner that conveys both expertise and caution.
-
-Character Consistency Score: 9
-Character Consistency Reasoning: The response maintains excellent consistency with Viktor's established technical communication style, focusing on potential applications while acknowledging limitations.
-```""",
-                # Medium response (average scores)
-                """```
-Overall Score: 5
-Overall Reasoning: This response adequately communicates basic technical information but lacks the precision and depth that characterizes Viktor's expertise.
-
-Primary Dimension Score: 6
-Primary Dimension Reasoning: The response addresses the technical question with reasonable accuracy but lacks the specific details and clarity that would make it truly representative of Viktor's knowledge.
-
-Character Consistency Score: 5
-Character Consistency Reasoning: The character consistency is average, with somewhat appropriate language but lacking Viktor's characteristic technical precision and focused communication.
-```""",
-                # Poor response (low scores)
-                """```
-Overall Score: 1
-Overall Reasoning: This response completely misrepresents Viktor's technical communication style with childish enthusiasm and vague descriptions that contradict his precise, scientific approach.
-
-Primary Dimension Score: 2
-Primary Dimension Reasoning: The response fails to provide any meaningful technical information, instead using emotional language and superficial descriptions.
-
-Character Consistency Score: 1
-Character Consistency Reasoning: The response shows no consistency with Viktor's established communication patterns, using exclamation points and emotional language that Viktor would never employ when discussing his work.
-```"""
-            ],
-            "relationship": [
-                # Good response (high scores)
-                """```
-Overall Score: 8
-Overall Reasoning: This response effectively captures Viktor's perspective on relationships with direct, practical language that focuses on the scientific partnership while acknowledging recent changes.
-
-Primary Dimension Score: 8
-Primary Dimension Reasoning: The response excels at addressing the relationship question, conveying Viktor's view of Jayce as a research partner first, with friendship as a secondary aspect centered around their work.
-
-Character Consistency Score: 9
-Character Consistency Reasoning: The response maintains excellent consistency with Viktor's established approach to relationships, focusing on shared work and scientific goals rather than emotional connections.
-```""",
-                # Medium response (average scores)
-                """```
-Overall Score: 6
-Overall Reasoning: This response adequately captures Viktor's perspective on his relationship with Jayce but lacks some nuance in how he views their connection through the lens of scientific progress.
-
-Primary Dimension Score: 5
-Primary Dimension Reasoning: The response addresses the relationship question with reasonable accuracy but doesn't fully capture the complexity of Viktor's view of Jayce as both colleague and friend.
-
-Character Consistency Score: 6
-Character Consistency Reasoning: The character consistency is acceptable, with appropriate focus on professional aspects, though it misses some of Viktor's characteristic perspective on how relationships serve scientific advancement.
-```""",
-                # Poor response (low scores)
-                """```
-Overall Score: 2
-Overall Reasoning: This response fundamentally misrepresents Viktor's approach to relationships with effusive emotional language and sentimentality that contradicts his established character.
-
-Primary Dimension Score: 1
-Primary Dimension Reasoning: The response completely fails to address how Viktor would view a relationship through the lens of shared work and scientific progress.
-
-Character Consistency Score: 3
-Character Consistency Reasoning: The response shows almost no consistency with Viktor's established patterns, using emotional language and expressing sentiments about friendship that Viktor would never articulate.
-```"""
-            ],
-            "philosophical": [
-                # Good response (high scores)
-                """```
-Overall Score: 9
-Overall Reasoning: This response excellently captures Viktor's philosophical perspective with precise, pragmatic language that focuses on practical applications rather than abstract concepts.
-
-Primary Dimension Score: 8
-Primary Dimension Reasoning: The response addresses the philosophical question with characteristic pragmatism, viewing "glorious evolution" not as philosophy but as a concrete technological goal.
-
-Character Consistency Score: 9
-Character Consistency Reasoning: The response maintains exceptional consistency with Viktor's established perspective, focusing on practical technological advancement rather than lofty idealism.
-```""",
-                # Medium response (average scores)
-                """```
-Overall Score: 7
-Overall Reasoning: This response adequately captures aspects of Viktor's philosophical perspective but lacks some of the precision and focus that characterizes his approach to such concepts.
-
-Primary Dimension Score: 6
-Primary Dimension Reasoning: The response addresses the philosophical question with reasonable accuracy but could be more focused on practical applications rather than conceptual aspects.
-
-Character Consistency Score: 7
-Character Consistency Reasoning: The character consistency is good, with appropriate language and focus on technology as a solution, though it could be more concise and direct.
-```""",
-                # Poor response (low scores)
-                """```
-Overall Score: 1
-Overall Reasoning: This response completely misrepresents Viktor's philosophical perspective with grandiose, emotional language that contradicts his methodical, pragmatic approach.
-
-Primary Dimension Score: 2
-Primary Dimension Reasoning: The response fails to address the philosophical question in a way consistent with Viktor's character, instead using dramatic language and focusing on power rather than progress.
-
-Character Consistency Score: 1
-Character Consistency Reasoning: The response shows no consistency with Viktor's established character, using emotional exclamations and dramatic language that Viktor would find inefficient and inappropriate.
-```"""
-            ]
-        }
+    
+    @property
+    def mock_responses(self):
+        """Responses by question type for more realistic variation, shared by all instances."""
+        return load_mock_responses()
     
     def generate(self, prompt: str, system_prompt=None) -> str:
         """Generate a mock response or evaluation based on the prompt."""
         # Check if this is an evaluation prompt
-        if "You are an expert evaluator for a character AI named Viktor" in prompt:
+        if prompt.startswith(_EVALUATION_PROMPT_MARKER):
             # Extract question and response from the evaluation prompt
-            question_match = re.search(r'Question: (.*?)\nResponse:', prompt, re.DOTALL)
-            response_match = re.search(r'Response: (.*?)(\n\nProvide exactly ONE|$)', prompt, re.DOTALL)
-            
-            question = question_match.group(1).strip() if question_match else "Unknown question"
-            response = response_match.group(1).strip() if response_match else "Unknown response"
-            
-            # Extract question type
-            if "identity question" in prompt:
-                question_type = "identity"
-            elif "technical question" in prompt:
-                question_type = "technical"
-            elif "relationship question" in prompt:
-                question_type = "relationship"
-            elif "philosophical question" in prompt:
-                question_type = "philosophical"
-            else:
-                question_type = "unknown"
-            
-            # Determine the type of response quality to simulate based on the response
-            if "poor" in response.lower() or "unknown" in response.lower():
-                quality = "low"
-            elif "good" in response.lower() or "optimal" in response.lower():
-                quality = "high"
+            match = _QUESTION_RESPONSE_RE.search(prompt)
+            if match:
+                question, response = match["question"].strip(), match["response"].strip()
             else:
-                quality = "medium"
+                question, response = "Unknown question", "Unknown response"
             
-            # Create mock evaluation
-            if quality == "high":
-                overall_score = 9.0
-                primary_score = 9.0
-                consistency_score = 8.0
-                overall_reasoning = "This response effectively captures Viktor's character with precise, technical language and stoic tone."
-                primary_reasoning = "The response demonstrates excellent understanding of Viktor's personality and priorities."
-                consistency_reasoning = "The response maintains Viktor's typical speech patterns and emotional restraint."
-            elif quality == "medium":
-                overall_score = 6.0
-                primary_score = 7.0
-                consistency_score = 6.0
-                overall_reasoning = "This response adequately captures Viktor's character but lacks some nuance."
-                primary_reasoning = "The response shows understanding of Viktor's core traits but could be more precise."
-                consistency_reasoning = "The response generally maintains Viktor's speech patterns with some inconsistencies."
-            else:  # low quality
-                overall_score = 3.0
-                primary_score = 2.0
-                consistency_score = 3.0
-                overall_reasoning = "This response fails to capture Viktor's character in several key ways."
-                primary_reasoning = "The response misrepresents Viktor's core traits and priorities."
-                consistency_reasoning = "The response does not maintain Viktor's typical speech patterns or emotional tone."
+            # Sample responses get their canned evaluation, in whatever order they are evaluated
+            position = _sample_positions().get((question, response))
+            if position is not None:
+                question_type, index = position
+                return self.mock_responses[question_type][index]
             
-            # Format the evaluation as JSON
-            evaluation = {
-                "overall_score": overall_score,
-                "overall_reasoning": overall_reasoning,
-                "primary_dimension_score": primary_score,
-                "primary_dimension_reasoning": primary_reasoning,
-                "character_consistency_score": consistency_score,
-                "character_consistency_reasoning": consistency_reasoning
-            }
+            # Determine the type of response quality to simulate based on the response
+            quality = next(
+                (quality for quality, pattern in _QUALITY_PATTERNS if pattern.search(response)),
+                "medium"
+            )
             
-            return json.dumps(evaluation, indent=2)
+            return _MOCK_QUALITY_EVALUATION_JSON[quality]
         else:
             # Original functionality for generating responses to questions
-            # Determine which response set to use based on the question type
-            if "identity" in prompt.lower():
-                response_set = self.mock_responses["identity"]
-                self.question_type = "identity"
-            elif "technical" in prompt.lower():
-                response_set = self.mock_responses["technical"]
-                self.question_type = "technical"
-            elif "relationship" in prompt.lower():
-                response_set = self.mock_responses["relationship"]
-                self.question_type = "relationship"
-            elif "philosophical" in prompt.lower():
-                response_set = self.mock_responses["philosophical"]
-                self.question_type = "philosophical"
-            else:
-                # Default to identity if question type can't be determined
-                response_set = self.mock_responses["identity"]
-                self.question_type = "identity"
+            # Determine which response set to use based on the question type,
+            # defaulting to identity if the question type can't be determined
+            mentioned = {match.lower() for match in _MOCK_QUESTION_TYPE_RE.findall(prompt)}
+            self.question_type = next(
+                (question_type for question_type in _MOCK_QUESTION_TYPES if question_type in mentioned),
+                "identity"
+            )
+            response_set = self.mock_responses[self.question_type]
             
             # Cycle through responses for this question type
             index = self.response_index % len(response_set)
@@ -420,21 +371,70 @@ def evaluate_response(response, question, evaluator_llm, question_type=None, hea
     # Use the Evaluator to evaluate the response
     return evaluator.evaluate_response(response, question, question_type, headings_map)
 
-def get_question_type(question, headings_map=None):
+def evaluate_responses(items, evaluator_llm, max_workers=MAX_EVALUATOR_WORKERS):
+    """
+    Evaluate several responses concurrently using the evaluator LLM.
+    
+    Each evaluation is an independent LLM round-trip, so the calls are
+    dispatched through a thread pool and kept in flight together.
+    
+    Args:
+        items: List of (response, question, question_type) tuples to evaluate
+        evaluator_llm: The LLM (or Evaluator instance) to use for evaluation
+        max_workers: Maximum number of evaluations in flight at once
+        
+    Returns:
+        List of evaluation metric dictionaries, in the same order as items
+    """
+    if not items:
+        return []
+    
+    # Build the Evaluator once and share it across the workers
+    if not isinstance(evaluator_llm, Evaluator):
+        evaluator_llm = Evaluator(evaluator_llm)
+    
+    evaluations = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = {
+            executor.submit(evaluate_response, response, question, evaluator_llm, question_type): index
+            for index, (response, question, question_type) in enumerate(items)
+        }
+        for completed, future in enumerate(as_completed(futures), 1):
+            evaluations[futures[future]] = future.result()
+            print(f"  Evaluated {completed}/{len(items)} responses")
+    
+    return evaluations
+
+class _DummyLLM:
+    """LLM stand-in for Evaluator methods that never call the LLM."""
+    
+    def generate(self, *args, **kwargs):
+        return ""
+
+# Shared Evaluator for the helpers below, which only use its LLM-free methods
+_OFFLINE_EVALUATOR = Evaluator(_DummyLLM())
+
+def get_question_type(question, headings_map=None, question_lower=None):
     """
     Determine the type of question based on its content.
     
     Args:
         question: The question to categorize
         headings_map: Optional dictionary mapping questions to their types from file sections
+        question_lower: Optional, the question already lowercased by the caller
         
     Returns:
         String indicating the question type (identity, technical, relationship, philosophical)
     """
-    # Create a temporary Evaluator with a dummy LLM to use its get_question_type method
-    dummy_llm = type('DummyLLM', (), {'generate': lambda *args, **kwargs: ''})()
-    evaluator = Evaluator(dummy_llm)
-    return evaluator.get_question_type(question, headings_map)
+    if headings_map is None:
+        # Without a headings map the answer depends only on the question text
+        return _question_type_from_text(question)
+    return _OFFLINE_EVALUATOR.get_question_type(question, headings_map, question_lower)
+
+@functools.lru_cache(maxsize=None)
+def _question_type_from_text(question):
+    """Categorize a question by its text alone, remembering the result."""
+    return _OFFLINE_EVALUATOR.get_question_type(question)
 
 def get_evaluation_criteria(question_type):
     """
@@ -446,10 +446,7 @@ def get_evaluation_criteria(question_type):
     Returns:
         String containing specific evaluation criteria for this question type
     """
-    # Create a temporary Evaluator with a dummy LLM to use its get_evaluation_criteria method
-    dummy_llm = type('DummyLLM', (), {'generate': lambda *args, **kwargs: ''})()
-    evaluator = Evaluator(dummy_llm)
-    return evaluator.get_evaluation_criteria(question_type)
+    return _OFFLINE_EVALUATOR.get_evaluation_criteria(question_type)
 
 def calculate_weighted_score(metrics):
     """
@@ -461,10 +458,7 @@ def calculate_weighted_score(metrics):
     Returns:
         Float representing the weighted overall score
     """
-    # Create a temporary Evaluator with a dummy LLM to use its calculate_weighted_score method
-    dummy_llm = type('DummyLLM', (), {'generate': lambda *args, **kwargs: ''})()
-    evaluator = Evaluator(dummy_llm)
-    return evaluator.calculate_weighted_score(metrics)
+    return _OFFLINE_EVALUATOR.calculate_weighted_score(metrics)
 
 def format_evaluation_output(metrics, question, response, weighted_score=None):
     """
@@ -479,10 +473,225 @@ def format_evaluation_output(metrics, question, response, weighted_score=None):
     Returns:
         String containing formatted evaluation output
     """
-    # Create a temporary Evaluator with a dummy LLM to use its format_evaluation_output method
-    dummy_llm = type('DummyLLM', (), {'generate': lambda *args, **kwargs: ''})()
-    evaluator = Evaluator(dummy_llm)
-    return evaluator.format_evaluation_output(metrics, question, response, weighted_score)
+    return _OFFLINE_EVALUATOR.format_evaluation_output(metrics, question, response, weighted_score)
+
+class CachedLLMInterface:
+    """
+    Wrapper around an LLM interface that answers repeated prompts from disk.
+    
+    Responses are stored as one text file per prompt, keyed by a hash of
+    CACHE_VERSION, the model name, temperature, system prompt and prompt.
+    Because the key covers the full evaluation prompt, changing the prompt or
+    the evaluation criteria automatically bypasses responses cached for the
+    old wording. Responses read or generated are also kept in memory, so a
+    prompt repeated within one run doesn't touch the disk again.
+    """
+    
+    def __init__(self, llm_interface, cache_dir):
+        """
+        Initialize the cache around an LLM interface.
+        
+        Args:
+            llm_interface: The LLM interface used when a prompt isn't cached
+            cache_dir: Directory the cached responses are stored in
+        """
+        self.llm_interface = llm_interface
+        self.config = llm_interface.config
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.memory = {}
+        self.hits = 0
+    
+    def get_cache_key(self, prompt, system_prompt=None):
+        """Build a stable cache key for a prompt sent with the current model settings."""
+        key_source = f"{CACHE_VERSION}|{self.config.model_name}|{self.config.temperature}|{system_prompt or ''}|{prompt}"
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+    
+    def generate(self, prompt, system_prompt=None):
+        """Return the cached response for a prompt, generating and caching it on a miss."""
+        cache_key = self.get_cache_key(prompt, system_prompt)
+        response = self.memory.get(cache_key)
+        if response is not None:
+            self.hits += 1
+            return response
+        
+        cache_path = self.cache_dir / f"{cache_key}.txt"
+        try:
+            response = cache_path.read_text(encoding="utf-8")
+            self.memory[cache_key] = response
+            self.hits += 1
+            return response
+        except FileNotFoundError:
+            pass
+        
+        response = self.llm_interface.generate(prompt, system_prompt)
+        self.memory[cache_key] = response
+        
+        # Write to a temporary file first so concurrent readers never see a partial response
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            temp_path.write_text(response, encoding="utf-8")
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write evaluator response cache {cache_path}: {e}")
+        
+        return response
+
+@functools.lru_cache(maxsize=None)
+def _evaluation_prompt_hash(question_type):
+    """Hash the evaluation prompt used for a question type."""
+    return hashlib.sha256(get_evaluation_prompt_prefix(question_type).encode("utf-8")).hexdigest()
+
+def semantic_cache_scope(evaluator_model, temperature, question_type, question):
+    """
+    Build the scope within which the semantic cache may reuse an evaluation.
+    
+    Besides the evaluator settings and the question, the scope covers
+    CACHE_VERSION and the evaluation prompt with its criteria, so evaluations
+    made with an older prompt or parser are never reused.
+    """
+    return (
+        f"{CACHE_VERSION}|{_evaluation_prompt_hash(question_type)}|"
+        f"{evaluator_model}|{temperature}|{question_type}|{question}"
+    )
+
+class SemanticEvaluationCache:
+    """
+    Cache of evaluations keyed by the meaning of the evaluated response.
+    
+    Responses are embedded with a sentence-transformers model, and a cached
+    evaluation is reused when a new response in the same scope (see
+    semantic_cache_scope) is at least `threshold` cosine-similar to one that
+    was already evaluated. The least recently used entries are evicted once
+    `max_entries` is reached.
+    """
+    
+    def __init__(self, cache_path, model_name="all-MiniLM-L6-v2", threshold=0.87, max_entries=1024):
+        """
+        Initialize the cache and load any entries saved by previous runs.
+        
+        Args:
+            cache_path: Path of the .npz file the cache is persisted to
+            model_name: Name of the sentence-transformers model used for embeddings
+            threshold: Minimum cosine similarity for a cached evaluation to be reused
+            max_entries: Maximum number of cached evaluations to keep
+        """
+        self.cache_path = Path(cache_path)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model = None
+        self.embeddings = None
+        self.scopes = []
+        self.evaluations = []
+        self.last_used = []
+        self.clock = 0
+        
+        try:
+            from sentence_transformers import SentenceTransformer
+            self.model = SentenceTransformer(model_name)
+        except ImportError:
+            print("Sentence-transformers not available, semantic evaluation cache disabled.")
+            return
+        
+        self._load()
+    
+    @property
+    def enabled(self):
+        """Whether the embedding model is available."""
+        return self.model is not None
+    
+    def embed(self, texts):
+        """
+        Embed responses in a single batch.
+        
+        Args:
+            texts: List of responses to embed
+            
+        Returns:
+            Float32 matrix with one normalized embedding per row
+        """
+        embeddings = self.model.encode(
+            texts, batch_size=32, convert_to_numpy=True, normalize_embeddings=True
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+    
+    def lookup(self, embedding, scope):
+        """
+        Find the evaluation of the most similar cached response in a scope.
+        
+        Args:
+            embedding: Normalized embedding of the response to evaluate
+            scope: String identifying the evaluator settings and question
+            
+        Returns:
+            The cached evaluation dictionary, or None if nothing is similar enough
+        """
+        candidates = [index for index, entry_scope in enumerate(self.scopes) if entry_scope == scope]
+        if not candidates:
+            return None
+        
+        # Embeddings are normalized, so the dot product is the cosine similarity
+        similarities = self.embeddings[candidates] @ embedding
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        
+        index = candidates[best]
+        self.clock += 1
+        self.last_used[index] = self.clock
+        return self.evaluations[index]
+    
+    def add(self, embedding, scope, evaluation):
+        """Add an evaluation for an embedded response, evicting the oldest entry if full."""
+        if len(self.scopes) >= self.max_entries:
+            oldest = self.last_used.index(min(self.last_used))
+            self.embeddings = np.delete(self.embeddings, oldest, axis=0)
+            del self.scopes[oldest]
+            del self.evaluations[oldest]
+            del self.last_used[oldest]
+        
+        row = embedding.reshape(1, -1)
+        self.embeddings = row if self.embeddings is None else np.vstack([self.embeddings, row])
+        self.scopes.append(scope)
+        self.evaluations.append(evaluation)
+        self.clock += 1
+        self.last_used.append(self.clock)
+    
+    def _load(self):
+        """Load cached entries from disk, starting empty if unavailable."""
+        if not self.cache_path.exists():
+            return
+        
+        try:
+            with np.load(self.cache_path, allow_pickle=False) as data:
+                self.embeddings = data["embeddings"].astype(np.float32)
+                self.scopes = data["scopes"].tolist()
+                self.evaluations = [json.loads(evaluation) for evaluation in data["evaluations"].tolist()]
+                self.last_used = data["last_used"].tolist()
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Warning: Could not read semantic evaluation cache {self.cache_path}: {e}")
+            self.embeddings = None
+            self.scopes, self.evaluations, self.last_used = [], [], []
+            return
+        
+        self.clock = max(self.last_used, default=0)
+    
+    def save(self):
+        """Save the cached entries to disk."""
+        if not self.enabled or self.embeddings is None:
+            return
+        
+        try:
+            with open(self.cache_path, "wb") as f:
+                np.savez(
+                    f,
+                    embeddings=self.embeddings,
+                    scopes=np.array(self.scopes),
+                    evaluations=np.array([json.dumps(evaluation) for evaluation in self.evaluations]),
+                    last_used=np.array(self.last_used, dtype=np.int64)
+                )
+        except OSError as e:
+            print(f"Warning: Could not write semantic evaluation cache {self.cache_path}: {e}")
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -490,99 +699,104 @@ def parse_arguments():
     parser.add_argument("--evaluator-model", type=str, default="llama3", help="Model to use for evaluation")
     parser.add_argument("--temperature", type=float, default=0.2, help="Temperature for generation")
     parser.add_argument("--max-tokens", type=int, default=1000, help="Maximum tokens for generation")
+    parser.add_argument("--question-type", type=str, default="all",
+                        choices=["all", "identity", "technical", "relationship", "philosophical"],
+                        help="Only evaluate the sample responses for this question type")
     parser.add_argument("--use-mock", action="store_true", help="Use mock implementation for testing")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always query the evaluator instead of reusing cached responses")
+    parser.add_argument("--parallel", type=int, default=parallel_requests_from_env(MAX_EVALUATOR_WORKERS),
+                        help="Maximum number of evaluator requests to keep in flight at once")
+    parser.add_argument("--semantic-cache", action="store_true",
+                        help="Also reuse evaluations of semantically similar responses")
+    parser.add_argument("--semantic-threshold", type=float, default=0.87,
+                        help="Minimum cosine similarity for the semantic cache to reuse an evaluation")
     
     return parser.parse_args()
 
-def create_markdown_report(evaluation_results, output_file):
+def create_markdown_report(evaluation_results, output_file, generated_at=None):
     """Create a markdown report of the evaluation results."""
-    with open(output_file, "w", encoding="utf-8") as f:
-        # Write header
-        f.write("# ViktorAI Evaluator Test Results\n\n")
-        f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"**Evaluator Model:** llama3\n\n")
-        
-        # Add summary
-        metrics = calculate_summary_statistics(evaluation_results)
-        f.write("## Summary\n\n")
-        f.write(f"- Total responses evaluated: {metrics['total_responses']}\n")
-        f.write(f"- Average Overall Score: {metrics['avg_overall_score']:.2f}/10\n")
-        f.write(f"- Average Primary Dimension Score: {metrics['avg_primary_dimension_score']:.2f}/10\n")
-        f.write(f"- Average Character Consistency Score: {metrics['avg_character_consistency_score']:.2f}/10\n\n")
-        
-        f.write("### Scores by Question Type\n\n")
-        f.write("| Question Type | Overall Score | Primary Dimension Score | Character Consistency Score |\n")
-        f.write("|--------------|--------------|------------------------|---------------------------|\n")
-        
-        for qtype in metrics["by_question_type"]:
-            qtype_metrics = metrics["by_question_type"][qtype]
-            f.write(f"| {qtype.capitalize()} | {qtype_metrics['avg_overall_score']:.2f}/10 | ")
-            f.write(f"{qtype_metrics['avg_primary_dimension_score']:.2f}/10 | ")
-            f.write(f"{qtype_metrics['avg_character_consistency_score']:.2f}/10 |\n")
-        
-        f.write("\n")
+    if generated_at is None:
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    metrics = calculate_summary_statistics(evaluation_results)
+    
+    # Header and summary
+    parts = [
+        "# ViktorAI Evaluator Test Results\n\n",
+        f"**Date:** {generated_at}\n",
+        "**Evaluator Model:** llama3\n\n",
+        "## Summary\n\n",
+        f"- Total responses evaluated: {metrics['total_responses']}\n",
+    ]
+    if metrics["errored_responses"]:
+        parts.append(f"- Responses that could not be evaluated: {metrics['errored_responses']}\n")
+    parts.append(
+        f"- Average Overall Score: {metrics['avg_overall_score']:.2f}/10\n"
+        f"- Average Primary Dimension Score: {metrics['avg_primary_dimension_score']:.2f}/10\n"
+        f"- Average Character Consistency Score: {metrics['avg_character_consistency_score']:.2f}/10\n\n"
+    )
+    
+    # Scores by question type
+    parts.append(
+        "### Scores by Question Type\n\n"
+        "| Question Type | Overall Score | Primary Dimension Score | Character Consistency Score |\n"
+        "|--------------|--------------|------------------------|---------------------------|\n"
+    )
+    parts.extend(
+        f"| {qtype.capitalize()} | {qtype_metrics['avg_overall_score']:.2f}/10 | "
+        f"{qtype_metrics['avg_primary_dimension_score']:.2f}/10 | "
+        f"{qtype_metrics['avg_character_consistency_score']:.2f}/10 |\n"
+        for qtype, qtype_metrics in metrics["by_question_type"].items()
+    )
+    parts.append("\n")
+    
+    # Each question type section
+    for qtype, questions in evaluation_results.items():
+        parts.append(f"## {qtype.capitalize()} Questions\n\n")
         
-        # Write each question type section
-        for qtype, questions in evaluation_results.items():
-            f.write(f"## {qtype.capitalize()} Questions\n\n")
+        for i, q_data in enumerate(questions, 1):
+            evaluation = q_data["evaluation"]
             
-            for i, q_data in enumerate(questions, 1):
-                question = q_data["question"]
-                response = q_data["response"]
-                evaluation = q_data["evaluation"]
-                
-                f.write(f"### Response {i}\n\n")
-                
-                f.write(f"**Question:** {question}\n")
-                f.write(f"**Question Type:** {qtype}\n\n")
-                
-                # Response
-                f.write("**Response:**\n")
-                f.write("```\n")
-                f.write(response)
-                f.write("\n```\n\n")
-                
-                # Evaluation
-                f.write("**Evaluation:**\n\n")
-                
-                overall_score = evaluation.get("overall_score", "N/A")
-                f.write(f"**Overall Score:** {overall_score}/10\n")
-                if "overall_reasoning" in evaluation:
-                    f.write(f"{evaluation['overall_reasoning']}\n\n")
-                
-                primary_score = evaluation.get("primary_dimension_score", "N/A")
-                f.write(f"**Primary Dimension Score:** {primary_score}/10\n")
-                if "primary_dimension_reasoning" in evaluation:
-                    f.write(f"{evaluation['primary_dimension_reasoning']}\n\n")
-                
-                consistency_score = evaluation.get("character_consistency_score", "N/A")
-                f.write(f"**Character Consistency Score:** {consistency_score}/10\n")
-                if "character_consistency_reasoning" in evaluation:
-                    f.write(f"{evaluation['character_consistency_reasoning']}\n\n")
-                
-                # Calculate weighted score based on question type
-                primary_weight = 0.6
-                consistency_weight = 0.4
-                
-                if primary_score != "N/A" and consistency_score != "N/A":
-                    try:
-                        weighted_score = (float(primary_score) * primary_weight) + (float(consistency_score) * consistency_weight)
-                        f.write(f"**Weighted Score (based on question type):** {weighted_score:.2f}/10\n\n")
-                    except (ValueError, TypeError):
-                        pass
-                
-                f.write("---\n\n")
-
-def create_html_report(evaluation_results, output_file):
-    """Create an HTML report of the evaluation results."""
-    html_content = f"""<!DOCTYPE html>
+            # Question and response
+            parts.append(
+                f"### Response {i}\n\n"
+                f"**Question:** {q_data['question']}\n"
+                f"**Question Type:** {qtype}\n\n"
+                f"**Response:**\n```\n{q_data['response']}\n```\n\n"
+                "**Evaluation:**\n\n"
+            )
+            
+            # Each score, followed by its reasoning when there is any
+            for label, score_key, reasoning_key in (
+                ("Overall Score", "overall_score", "overall_reasoning"),
+                ("Primary Dimension Score", "primary_dimension_score", "primary_dimension_reasoning"),
+                ("Character Consistency Score", "character_consistency_score", "character_consistency_reasoning"),
+            ):
+                parts.append(f"**{label}:** {evaluation.get(score_key, 'N/A')}/10\n")
+                reasoning = evaluation.get(reasoning_key)
+                if reasoning is not None:
+                    parts.append(f"{reasoning}\n\n")
+            
+            # Weighted score based on question type, computed by the evaluator
+            weighted_score = evaluation.get("weighted_score")
+            if weighted_score is not None:
+                parts.append(f"**Weighted Score (based on question type):** {weighted_score:.2f}/10\n\n")
+            
+            parts.append("---\n\n")
+    
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
+
+# Static parts of the HTML report, built once at import time
+HTML_REPORT_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Viktor AI Evaluation Results</title>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             color: #333;
@@ -590,144 +804,183 @@ def create_html_report(evaluation_results, output_file):
             margin: 0 auto;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        h1, h2, h3, h4 {{
+        }
+        h1, h2, h3, h4 {
             color: #2c3e50;
-        }}
-        h1 {{
+        }
+        h1 {
             text-align: center;
             border-bottom: 2px solid #3498db;
             padding-bottom: 10px;
             margin-bottom: 30px;
-        }}
-        .timestamp {{
+        }
+        .timestamp {
             text-align: center;
             color: #7f8c8d;
             margin-bottom: 30px;
-        }}
-        .question-section {{
+        }
+        .question-section {
             background-color: white;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             padding: 20px;
             margin-bottom: 30px;
-        }}
-        .question {{
+        }
+        .question {
             background-color: #eaf2f8;
             padding: 15px;
             border-radius: 5px;
             border-left: 5px solid #3498db;
             margin-bottom: 15px;
-        }}
-        .response {{
+        }
+        .response {
             background-color: #f9f9f9;
             padding: 15px;
             border-radius: 5px;
             border-left: 5px solid #2ecc71;
             margin-bottom: 15px;
             white-space: pre-wrap;
-        }}
-        .response-text {{
+        }
+        .response-text {
             margin: 0;
             padding: 0;
-        }}
-        .evaluation {{
+        }
+        .evaluation {
             background-color: #f8f9fa;
             padding: 15px;
             border-radius: 5px;
             border-left: 5px solid #f39c12;
-        }}
-        .score-container {{
+        }
+        .score-container {
             display: flex;
             flex-direction: column;
             gap: 20px;
             margin-bottom: 15px;
-        }}
-        .score-row {{
+        }
+        .score-row {
             display: flex;
             flex-wrap: wrap;
             gap: 20px;
             width: 100%;
-        }}
-        .score-box {{
+        }
+        .score-box {
             flex: 1;
             min-width: 200px;
             padding: 10px;
             border-radius: 5px;
             background-color: #fff;
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
-        .score-title {{
+        }
+        .score-title {
             font-weight: bold;
             margin-bottom: 5px;
-        }}
-        .score-value {{
+        }
+        .score-value {
             font-size: 24px;
             font-weight: bold;
             margin-bottom: 5px;
-        }}
-        .score-bar {{
+        }
+        .score-bar {
             height: 10px;
             background-color: #ecf0f1;
             border-radius: 5px;
             margin-bottom: 10px;
             position: relative;
-        }}
-        .score-fill {{
+        }
+        .score-fill {
             height: 100%;
             border-radius: 5px;
             position: absolute;
             top: 0;
             left: 0;
-        }}
-        .score-reasoning {{
+        }
+        .score-reasoning {
             font-style: italic;
             color: #555;
-        }}
-        .weighted-score {{
+        }
+        .weighted-score {
             font-weight: bold;
             margin-top: 15px;
             padding: 10px;
             background-color: #f8f9f9;
             border-radius: 5px;
             text-align: right;
-        }}
-        .high-score {{ background-color: #2ecc71; }}
-        .medium-score {{ background-color: #f39c12; }}
-        .low-score {{ background-color: #e74c3c; }}
-        .summary {{
+        }
+        .high-score { background-color: #2ecc71; }
+        .medium-score { background-color: #f39c12; }
+        .low-score { background-color: #e74c3c; }
+        .summary {
             background-color: white;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             padding: 20px;
             margin-bottom: 30px;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 15px 0;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 10px;
             text-align: left;
             border-bottom: 1px solid #ddd;
-        }}
-        th {{
+        }
+        th {
             background-color: #f2f2f2;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #f5f5f5;
-        }}
+        }
     </style>
 </head>
 <body>
     <h1>Viktor AI Evaluation Results</h1>
-    <div class="timestamp">Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>
 """
 
+HTML_SECTION_HEADER = """
+    <div class="question-section">
+        <h2>{title} Questions</h2>
+"""
+
+HTML_REPORT_FOOT = """
+</body>
+</html>
+"""
+
+# CSS class of a score's bar, indexed by the whole part of the score (0-10)
+_SCORE_CLASSES = ("low-score",) * 5 + ("medium-score",) * 3 + ("high-score",) * 3
+
+def get_score_class(score):
+    """
+    Get the CSS class used to color a score in the HTML report.
+    
+    Args:
+        score: A score between 0 and 10
+        
+    Returns:
+        "high-score" for 8 and above, "medium-score" for 5 and above, else "low-score"
+    """
+    return _SCORE_CLASSES[min(max(int(score), 0), 10)]
+
+def create_html_report(evaluation_results, output_file, generated_at=None):
+    """Create an HTML report of the evaluation results."""
+    if generated_at is None:
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    # Stream the report through a large write buffer instead of building it in memory
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        write_html_report(evaluation_results, f, generated_at)
+
+def write_html_report(evaluation_results, f, generated_at):
+    """Write an HTML report of the evaluation results to an open text file."""
+    f.write(HTML_REPORT_HEAD)
+    f.write(f"""    <div class="timestamp">Generated on {generated_at}</div>
+""")
+
     # Add summary
     metrics = calculate_summary_statistics(evaluation_results)
-    html_content += f"""
+    f.write(f"""
     <div class="summary">
         <h2>Summary</h2>
         <table>
@@ -757,36 +1010,56 @@ def create_html_report(evaluation_results, output_file):
                 <th>Average Primary Dimension Score</th>
                 <th>Average Character Consistency Score</th>
             </tr>
-"""
+""")
 
     for qtype in metrics["by_question_type"]:
         qtype_metrics = metrics["by_question_type"][qtype]
-        html_content += f"""
+        f.write(f"""
             <tr>
                 <td>{qtype.capitalize()}</td>
                 <td>{qtype_metrics["avg_overall_score"]:.2f}/10</td>
                 <td>{qtype_metrics["avg_primary_dimension_score"]:.2f}/10</td>
                 <td>{qtype_metrics["avg_character_consistency_score"]:.2f}/10</td>
             </tr>
-"""
+""")
 
-    html_content += """
+    f.write("""
         </table>
     </div>
-"""
+""")
 
     # Add detailed results
     for qtype, questions in evaluation_results.items():
-        html_content += f"""
-    <div class="question-section">
-        <h2>{qtype.capitalize()} Questions</h2>
-"""
+        f.write(HTML_SECTION_HEADER.format(title=qtype.capitalize()))
         for q_idx, q_data in enumerate(questions, 1):
-            question = q_data["question"]
-            response = q_data["response"]
+            # Text is placed inside elements, so quotes can stay as they are
+            question = escape(q_data["question"], quote=False)
+            response = escape(q_data["response"], quote=False)
             evaluation = q_data["evaluation"]
             
-            html_content += f"""
+            # Overall score (full width), then the primary dimension and
+            # character consistency scores side by side
+            overall_score = evaluation.get("overall_score", 0)
+            primary_score = evaluation.get("primary_dimension_score", 0)
+            consistency_score = evaluation.get("character_consistency_score", 0)
+            overall_reasoning = escape(str(evaluation.get("overall_reasoning", "No reasoning provided.")), quote=False)
+            primary_reasoning = escape(str(evaluation.get("primary_dimension_reasoning", "No reasoning provided.")), quote=False)
+            consistency_reasoning = escape(str(evaluation.get("character_consistency_reasoning", "No reasoning provided.")), quote=False)
+            
+            score_class = get_score_class(overall_score)
+            primary_class = get_score_class(primary_score)
+            consistency_class = get_score_class(consistency_score)
+            
+            # Weighted score, computed by the evaluator
+            weighted_score = evaluation.get("weighted_score")
+            weighted_html = "" if weighted_score is None else f"""
+                <div class="weighted-score">
+                    Weighted Score (based on question type): {weighted_score:.2f}/10
+                </div>
+"""
+            
+            # Write the whole question block in one call
+            f.write(f"""
         <h3>Question {q_idx}</h3>
         <div class="question">
             <strong>Q:</strong> {question}
@@ -798,13 +1071,7 @@ def create_html_report(evaluation_results, output_file):
         <div class="evaluation">
             <h4>Evaluation</h4>
             <div class="score-container">
-"""
 
-            # Overall Score (Full Width)
-            overall_score = evaluation.get("overall_score", 0)
-            score_class = "high-score" if overall_score >= 8 else "medium-score" if overall_score >= 5 else "low-score"
-            
-            html_content += f"""
                 <div class="score-row">
                     <div class="score-box">
                         <div class="score-title">Overall Score</div>
@@ -812,19 +1079,10 @@ def create_html_report(evaluation_results, output_file):
                         <div class="score-bar">
                             <div class="score-fill {score_class}" style="width: {overall_score * 10}%;"></div>
                         </div>
-                        <div class="score-reasoning">{evaluation.get("overall_reasoning", "No reasoning provided.")}</div>
+                        <div class="score-reasoning">{overall_reasoning}</div>
                     </div>
                 </div>
-"""
 
-            # Primary Dimension Score and Character Consistency Score (Side by Side)
-            primary_score = evaluation.get("primary_dimension_score", 0)
-            consistency_score = evaluation.get("character_consistency_score", 0)
-            
-            primary_class = "high-score" if primary_score >= 8 else "medium-score" if primary_score >= 5 else "low-score"
-            consistency_class = "high-score" if consistency_score >= 8 else "medium-score" if consistency_score >= 5 else "low-score"
-            
-            html_content += f"""
                 <div class="score-row">
                     <div class="score-box">
                         <div class="score-title">Primary Dimension Score</div>
@@ -832,7 +1090,7 @@ def create_html_report(evaluation_results, output_file):
                         <div class="score-bar">
                             <div class="score-fill {primary_class}" style="width: {primary_score * 10}%;"></div>
                         </div>
-                        <div class="score-reasoning">{evaluation.get("primary_dimension_reasoning", "No reasoning provided.")}</div>
+                        <div class="score-reasoning">{primary_reasoning}</div>
                     </div>
 
                     <div class="score-box">
@@ -841,42 +1099,19 @@ def create_html_report(evaluation_results, output_file):
                         <div class="score-bar">
                             <div class="score-fill {consistency_class}" style="width: {consistency_score * 10}%;"></div>
                         </div>
-                        <div class="score-reasoning">{evaluation.get("character_consistency_reasoning", "No reasoning provided.")}</div>
+                        <div class="score-reasoning">{consistency_reasoning}</div>
                     </div>
                 </div>
-"""
-
-            # Add weighted score
-            primary_weight = 0.6
-            consistency_weight = 0.4
-            
-            try:
-                weighted_score = (float(primary_score) * primary_weight) + (float(consistency_score) * consistency_weight)
-                html_content += f"""
-                <div class="weighted-score">
-                    Weighted Score (based on question type): {weighted_score:.2f}/10
-                </div>
-"""
-            except (ValueError, TypeError):
-                pass
-
-            html_content += """
+{weighted_html}
             </div>
         </div>
-"""
+""")
         
-        html_content += """
+        f.write("""
     </div>
-"""
-
-    html_content += """
-</body>
-</html>
-"""
+""")
 
-    # Write HTML report to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    f.write(HTML_REPORT_FOOT)
 
 def calculate_summary_statistics(evaluation_results):
     """
@@ -893,99 +1128,89 @@ def calculate_summary_statistics(evaluation_results):
         "avg_primary_dimension_score": 0.0,
         "avg_character_consistency_score": 0.0,
         "total_responses": 0,
+        "errored_responses": 0,
         "by_question_type": {}
     }
     
-    # Initialize counters
-    overall_scores = []
-    primary_scores = []
-    consistency_scores = []
-    
-    # Initialize per-question-type metrics
-    for qtype in evaluation_results:
-        metrics["by_question_type"][qtype] = {
-            "avg_overall_score": 0.0,
-            "avg_primary_dimension_score": 0.0,
-            "avg_character_consistency_score": 0.0,
-            "count": 0,
-            "overall_scores": [],
-            "primary_scores": [],
-            "consistency_scores": []
-        }
+    # Score columns, in the order they are stored in the per-type score arrays
+    score_keys = ("overall_score", "primary_dimension_score", "character_consistency_score")
+    avg_keys = ("avg_overall_score", "avg_primary_dimension_score", "avg_character_consistency_score")
     
-    # Collect all metrics
+    # Running totals of each score column across all question types
+    score_totals = np.zeros(len(score_keys), dtype=np.float64)
+    
+    # Collect each question type's scores into one (responses x 3) array
     for qtype, questions in evaluation_results.items():
-        qtype_metrics = metrics["by_question_type"][qtype]
+        # Evaluations that failed carry placeholder scores, so leave them out
+        scored = [q_data for q_data in questions if not q_data["evaluation"].get("errored")]
+        metrics["errored_responses"] += len(questions) - len(scored)
+        questions = scored
         
-        for q_data in questions:
+        scores = np.empty((len(questions), len(score_keys)), dtype=np.float64)
+        for row, q_data in enumerate(questions):
             evaluation = q_data["evaluation"]
-            
             # Extract scores, defaulting to 0 if missing
-            overall_score = float(evaluation.get("overall_score", 0))
-            primary_score = float(evaluation.get("primary_dimension_score", 0))
-            consistency_score = float(evaluation.get("character_consistency_score", 0))
-            
-            # Add to overall lists
-            overall_scores.append(overall_score)
-            primary_scores.append(primary_score)
-            consistency_scores.append(consistency_score)
-            
-            # Add to question-type specific lists
-            qtype_metrics["overall_scores"].append(overall_score)
-            qtype_metrics["primary_scores"].append(primary_score)
-            qtype_metrics["consistency_scores"].append(consistency_score)
-            qtype_metrics["count"] += 1
-            metrics["total_responses"] += 1
-    
-    # Calculate overall averages
-    if overall_scores:
-        metrics["avg_overall_score"] = sum(overall_scores) / len(overall_scores)
-    if primary_scores:
-        metrics["avg_primary_dimension_score"] = sum(primary_scores) / len(primary_scores)
-    if consistency_scores:
-        metrics["avg_character_consistency_score"] = sum(consistency_scores) / len(consistency_scores)
-    
-    # Calculate question-type specific averages
-    for qtype, qtype_metrics in metrics["by_question_type"].items():
-        if qtype_metrics["overall_scores"]:
-            qtype_metrics["avg_overall_score"] = sum(qtype_metrics["overall_scores"]) / len(qtype_metrics["overall_scores"])
-        if qtype_metrics["primary_scores"]:
-            qtype_metrics["avg_primary_dimension_score"] = sum(qtype_metrics["primary_scores"]) / len(qtype_metrics["primary_scores"])
-        if qtype_metrics["consistency_scores"]:
-            qtype_metrics["avg_character_consistency_score"] = sum(qtype_metrics["consistency_scores"]) / len(qtype_metrics["consistency_scores"])
+            scores[row] = [float(evaluation.get(key, 0)) for key in score_keys]
+            score_totals += scores[row]
+        
+        qtype_metrics = {key: 0.0 for key in avg_keys}
+        qtype_metrics["count"] = len(questions)
+        if len(questions):
+            qtype_metrics.update(zip(avg_keys, scores.mean(axis=0).tolist()))
         
-        # Clean up temporary lists to reduce memory usage
-        del qtype_metrics["overall_scores"]
-        del qtype_metrics["primary_scores"]
-        del qtype_metrics["consistency_scores"]
+        metrics["by_question_type"][qtype] = qtype_metrics
+        metrics["total_responses"] += len(questions)
+    
+    # Calculate overall averages from the running totals
+    if metrics["total_responses"]:
+        metrics.update(zip(avg_keys, (score_totals / metrics["total_responses"]).tolist()))
     
     return metrics
 
+def publish_latest(source_path, latest_path):
+    """
+    Point a "latest" file at the output of the current run.
+    
+    The latest file is replaced by a hard link to the run's file, so no data
+    is copied. Where hard links aren't available (for example across file
+    systems), the file is copied instead.
+    
+    Args:
+        source_path: Path of the file written by the current run
+        latest_path: Path of the "latest" file to update
+    """
+    try:
+        latest_path.unlink()
+    except FileNotFoundError:
+        pass
+    
+    try:
+        os.link(source_path, latest_path)
+    except OSError:
+        shutil.copy2(source_path, latest_path)
+
 def main():
     """Main function to run the evaluator test."""
     args = parse_arguments()
     
-    # Create base output directory
+    # Base output directory
     output_dir = Path("evaluator_test_results")
-    output_dir.mkdir(exist_ok=True)
     
-    # Get current timestamp for this run
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Get current timestamp for this run, shared by the file names and the report headers
+    run_started = datetime.now()
+    timestamp = run_started.strftime("%Y%m%d_%H%M%S")
+    generated_at = run_started.strftime('%Y-%m-%d %H:%M:%S')
     
     # Create a safe model name for directories
     safe_model_name = args.evaluator_model.replace(":", "_")
     
-    # Create model-specific directories
+    # Model-specific and run-specific directories
     model_dir = output_dir / safe_model_name
-    model_dir.mkdir(exist_ok=True)
-    
-    # Create run-specific directory
     run_dir = model_dir / f"run_{timestamp}"
-    run_dir.mkdir(exist_ok=True)
     
-    # Create raw_data and visualizations directories
+    # Create the raw_data and visualizations directories along with their parents
     raw_data_dir = run_dir / "raw_data"
-    raw_data_dir.mkdir(exist_ok=True)
+    raw_data_dir.mkdir(parents=True, exist_ok=True)
     
     visualizations_dir = run_dir / "visualizations"
     visualizations_dir.mkdir(exist_ok=True)
@@ -1001,6 +1226,11 @@ def main():
     json_latest_path = model_dir / f"evaluator_test_{safe_model_name}_latest.json"
     
     # Configure OllamaInterface for evaluation
+    if not args.use_mock and OllamaInterface is None:
+        print("Warning: OllamaInterface could not be imported.")
+        print("Continuing with --use-mock=True to avoid errors.")
+        args.use_mock = True
+    
     if args.use_mock:
         print("Using mock implementation for OllamaInterface")
         evaluator = MockOllamaInterface({})
@@ -1013,77 +1243,104 @@ def main():
         )
         evaluator = OllamaInterface(evaluator_config)
     
+    # Resolve the question types to evaluate once, up front
+    question_types = list(SAMPLE_RESPONSES) if args.question_type == "all" else [args.question_type]
+    
     # Initialize results dictionary
-    results = {
-        "identity": [],
-        "technical": [],
-        "relationship": [],
-        "philosophical": []
-    }
+    results = {qtype: [] for qtype in question_types}
     
-    # Process identity questions
-    print("Evaluating identity questions...")
-    for i, q_data in enumerate(IDENTITY_SAMPLES, 1):
-        print(f"  Evaluating response {i}...")
-        metrics = evaluate_response(q_data["response"], q_data["question"], evaluator, "identity")
-        
-        results["identity"].append({
-            "question": q_data["question"],
-            "response": q_data["response"],
-            "evaluation": metrics
-        })
+    # Flatten the sample sets into one ordered task list so the evaluator calls,
+    # which are dominated by the LLM round-trip, can be in flight concurrently
+    tasks = [
+        (qtype, i, q_data)
+        for qtype in question_types
+        for i, q_data in enumerate(get_samples(qtype), 1)
+    ]
     
-    # Process technical questions
-    print("Evaluating technical questions...")
-    for i, q_data in enumerate(TECHNICAL_SAMPLES, 1):
-        print(f"  Evaluating response {i}...")
-        metrics = evaluate_response(q_data["response"], q_data["question"], evaluator, "technical")
-        
-        results["technical"].append({
-            "question": q_data["question"],
-            "response": q_data["response"],
-            "evaluation": metrics
-        })
+    # Reuse evaluator responses from previous runs; the mock is order-dependent, so never cache it
+    use_cache = not (args.use_mock or args.no_cache)
+    evaluator_llm = evaluator
+    if use_cache:
+        evaluator_llm = CachedLLMInterface(evaluator, output_dir / LLM_CACHE_DIRNAME)
     
-    # Process relationship questions
-    print("Evaluating relationship questions...")
-    for i, q_data in enumerate(RELATIONSHIP_SAMPLES, 1):
-        print(f"  Evaluating response {i}...")
-        metrics = evaluate_response(q_data["response"], q_data["question"], evaluator, "relationship")
-        
-        results["relationship"].append({
-            "question": q_data["question"],
-            "response": q_data["response"],
-            "evaluation": metrics
-        })
+    evaluations = {}
+    pending = list(tasks)
     
-    # Process philosophical questions
-    print("Evaluating philosophical questions...")
-    for i, q_data in enumerate(PHILOSOPHICAL_SAMPLES, 1):
-        print(f"  Evaluating response {i}...")
-        metrics = evaluate_response(q_data["response"], q_data["question"], evaluator, "philosophical")
+    # Fall back to evaluations of near-identical responses when requested
+    semantic_cache = None
+    semantic_keys = {}
+    if use_cache and args.semantic_cache and pending:
+        semantic_cache = SemanticEvaluationCache(output_dir / SEMANTIC_CACHE_FILENAME,
+                                                 threshold=args.semantic_threshold)
+    
+    if semantic_cache is not None and semantic_cache.enabled:
+        # Embed every pending response in one batch rather than one model call each
+        embeddings = semantic_cache.embed([q_data["response"] for _, _, q_data in pending])
+        still_pending = []
+        for (qtype, i, q_data), embedding in zip(pending, embeddings):
+            scope = semantic_cache_scope(args.evaluator_model, args.temperature, qtype, q_data["question"])
+            cached = semantic_cache.lookup(embedding, scope)
+            if cached is not None:
+                evaluations[(qtype, i)] = cached
+            else:
+                semantic_keys[(qtype, i)] = (embedding, scope)
+                still_pending.append((qtype, i, q_data))
         
-        results["philosophical"].append({
+        if len(still_pending) < len(pending):
+            print(f"Reusing {len(pending) - len(still_pending)} evaluations of similar responses")
+        pending = still_pending
+    
+    # Evaluate each distinct (response, question, question type) only once per run
+    pending_items = [(q_data["response"], q_data["question"], qtype) for qtype, i, q_data in pending]
+    unique_items = list(dict.fromkeys(pending_items))
+    
+    max_workers = max(1, args.parallel)
+    print(f"Evaluating {len(unique_items)} responses...")
+    
+    unique_metrics = dict(zip(
+        unique_items,
+        evaluate_responses(unique_items, evaluator_llm, max_workers=max_workers)
+    ))
+    if use_cache and evaluator_llm.hits:
+        print(f"Reused {evaluator_llm.hits} cached evaluator responses from {evaluator_llm.cache_dir}")
+    
+    for (qtype, i, q_data), item in zip(pending, pending_items):
+        metrics = unique_metrics[item]
+        evaluations[(qtype, i)] = metrics
+        # Don't cache fallback scores from failed evaluator calls
+        if (qtype, i) in semantic_keys and not metrics.get("errored"):
+            semantic_cache.add(*semantic_keys[(qtype, i)], metrics)
+    
+    if semantic_cache is not None and pending:
+        semantic_cache.save()
+    
+    # Collect results in the original sample order so the reports are deterministic
+    for qtype, i, q_data in tasks:
+        results[qtype].append({
             "question": q_data["question"],
             "response": q_data["response"],
-            "evaluation": metrics
+            "evaluation": evaluations[(qtype, i)]
         })
     
     # Save raw results as JSON
-    with open(json_output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        with open(json_output_path, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        # Write through a large buffer since json.dump writes in small pieces
+        with open(json_output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(results, f, indent=2)
     
     # Generate reports
-    create_markdown_report(results, md_output_path)
-    create_html_report(results, html_output_path)
+    create_markdown_report(results, md_output_path, generated_at)
+    create_html_report(results, html_output_path, generated_at)
     
-    # Create/update the "latest" copies
+    # Create/update the "latest" files
     try:
-        # Copy the files (don't use symlinks as they might not work on all systems)
-        import shutil
-        shutil.copy2(md_output_path, md_latest_path)
-        shutil.copy2(html_output_path, html_latest_path)
-        shutil.copy2(json_output_path, json_latest_path)
+        # Hard links rather than symlinks, as symlinks might not work on all systems
+        publish_latest(md_output_path, md_latest_path)
+        publish_latest(html_output_path, html_latest_path)
+        publish_latest(json_output_path, json_latest_path)
     except Exception as e:
         print(f"Warning: Failed to create latest links: {e}")
     
@@ -0,0 +1,122 @@
+"""
+Tests for parsing the evaluator LLM's response.
+
+This module checks that Evaluator.evaluate_response reads the scores and
+reasoning from the formats evaluator models commonly answer in.
+"""
+
+import os
+import sys
+import unittest
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.evaluator import Evaluator
+
+
+class CannedLLM:
+    """LLM interface that answers every prompt with the same text."""
+
+    def __init__(self, response):
+        self.response = response
+
+    def generate(self, prompt):
+        return self.response
+
+
+class TestEvaluationParsing(unittest.TestCase):
+    """Tests for the text formats accepted from the evaluator."""
+
+    def evaluate(self, evaluation_response):
+        """Evaluate a sample response with an evaluator that returns the given text."""
+        evaluator = Evaluator(CannedLLM(evaluation_response))
+        return evaluator.evaluate_response(
+            "The Hexcore adapts.", "What is the Hexcore?", "technical"
+        )
+
+    def assertParsed(self, metrics, scores, reasonings):
+        """Check the three scores and reasonings parsed from an evaluation."""
+        self.assertNotIn("errored", metrics)
+        self.assertEqual(
+            (
+                metrics["overall_score"],
+                metrics["primary_dimension_score"],
+                metrics["character_consistency_score"],
+            ),
+            scores,
+        )
+        self.assertEqual(
+            (
+                metrics["overall_reasoning"],
+                metrics["primary_dimension_reasoning"],
+                metrics["character_consistency_reasoning"],
+            ),
+            reasonings,
+        )
+
+    def test_plain_labels(self):
+        """Test one field per line, as the evaluation prompt asks for."""
+        metrics = self.evaluate(
+            "Overall Score: 8\n"
+            "Overall Reasoning: Accurate and in character.\n\n"
+            "Primary Dimension Score: 7/10\n"
+            "Primary Dimension Reasoning: Precise terminology.\n\n"
+            "Character Consistency Score: 9\n"
+            "Character Consistency Reasoning: Stoic and technical."
+        )
+        self.assertParsed(
+            metrics,
+            (8.0, 7.0, 9.0),
+            ("Accurate and in character.", "Precise terminology.", "Stoic and technical."),
+        )
+
+    def test_numbered_labels(self):
+        """Test fields written as a numbered list."""
+        metrics = self.evaluate(
+            "1. Overall Score: 8\n"
+            "2. Overall Reasoning: ok\n"
+            "3. Primary Dimension Score: 7\n"
+            "4. Primary Dimension Reasoning: fine\n"
+            "5. Character Consistency Score: 9\n"
+            "6. Character Consistency Reasoning: great"
+        )
+        self.assertParsed(metrics, (8.0, 7.0, 9.0), ("ok", "fine", "great"))
+
+    def test_bold_labels(self):
+        """Test labels in markdown bold, with and without list numbering."""
+        for prefix in ("", "1. "):
+            with self.subTest(prefix=prefix):
+                metrics = self.evaluate(
+                    f"{prefix}**Overall Score:** 8\n"
+                    f"{prefix}**Overall Reasoning:** ok\n\n"
+                    f"{prefix}**Primary Dimension Score:** 7\n"
+                    f"{prefix}**Primary Dimension Reasoning:** fine\n\n"
+                    f"{prefix}**Character Consistency Score:** 9\n"
+                    f"{prefix}**Character Consistency Reasoning:** great"
+                )
+                self.assertParsed(metrics, (8.0, 7.0, 9.0), ("ok", "fine", "great"))
+
+    def test_inline_labels(self):
+        """Test fields run together in a paragraph."""
+        for preamble in ("", "Here is my evaluation. "):
+            with self.subTest(preamble=preamble):
+                metrics = self.evaluate(
+                    f"{preamble}Overall Score: 8. Overall Reasoning: ok overall. "
+                    "Primary Dimension Score: 6. Primary Dimension Reasoning: decent. "
+                    "Character Consistency Score: 7. Character Consistency Reasoning: mostly."
+                )
+                self.assertParsed(
+                    metrics, (8.0, 6.0, 7.0), ("ok overall.", "decent.", "mostly.")
+                )
+
+    def test_missing_scores_fall_back(self):
+        """Test that scores missing from the evaluation get the middle score."""
+        metrics = self.evaluate("I cannot evaluate this response.")
+        self.assertEqual(metrics["overall_score"], 5.0)
+        self.assertEqual(metrics["primary_dimension_score"], 5.0)
+        self.assertEqual(metrics["character_consistency_score"], 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests for the mock evaluator used by `test_evaluator.py --use-mock`.
+
+This module checks that the mock recognizes the Evaluator's prompt and
+answers it with the canned evaluation of the sample being evaluated.
+"""
+
+import os
+import sys
+import json
+import unittest
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import Config
+from src.evaluator import Evaluator
+from tests.test_evaluator import (
+    MOCK_EVALUATIONS_FILE,
+    SAMPLE_RESPONSES,
+    MockOllamaInterface,
+    evaluate_responses,
+)
+
+
+class TestMockEvaluator(unittest.TestCase):
+    """Tests for MockOllamaInterface answering evaluation prompts."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.mock = MockOllamaInterface(Config())
+        self.evaluator = Evaluator(self.mock)
+        with open(MOCK_EVALUATIONS_FILE, "r", encoding="utf-8") as f:
+            self.canned_evaluations = json.load(f)
+
+    def test_sample_gets_its_canned_evaluation(self):
+        """Test that each sample response is scored with its own canned evaluation."""
+        for question_type, samples in SAMPLE_RESPONSES.items():
+            for index, response in enumerate(samples["responses"]):
+                with self.subTest(question_type=question_type, index=index):
+                    metrics = self.evaluator.evaluate_response(
+                        response, samples["question"], question_type
+                    )
+                    expected = self.canned_evaluations[question_type][index]
+                    self.assertEqual(metrics["overall_score"], expected["overall_score"])
+                    self.assertEqual(
+                        metrics["primary_dimension_score"],
+                        expected["primary_dimension_score"],
+                    )
+                    self.assertEqual(
+                        metrics["character_consistency_score"],
+                        expected["character_consistency_score"],
+                    )
+                    self.assertEqual(
+                        metrics["overall_reasoning"], expected["overall_reasoning"]
+                    )
+
+        # The evaluation prompts never reached the mock's response cycling
+        self.assertEqual(self.mock.response_index, 0)
+
+    def test_evaluation_order_does_not_matter(self):
+        """Test that concurrent evaluations get the same results as serial ones."""
+        items = [
+            (response, samples["question"], question_type)
+            for question_type, samples in SAMPLE_RESPONSES.items()
+            for response in samples["responses"]
+        ]
+        serial = evaluate_responses(items, self.evaluator, max_workers=1)
+        concurrent = evaluate_responses(items, self.evaluator, max_workers=8)
+        self.assertEqual(serial, concurrent)
+
+    def test_unknown_response_gets_medium_evaluation(self):
+        """Test that responses that aren't samples get the medium evaluation."""
+        metrics = self.evaluator.evaluate_response(
+            "The Hexcore is a remarkable device.", "What is the Hexcore?", "technical"
+        )
+        self.assertEqual(metrics["overall_score"], 6.0)
+        self.assertNotIn("errored", metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,22 +12,49 @@ import sys
 import time
 import json
 import argparse
+import hashlib
+import functools
 import requests
 from datetime import datetime
 from pathlib import Path
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the parent directory to the path so we can import the src modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# When run as a plain script, add the parent directory to the path so we can import
+# the src modules; under pytest or `python -m tests.test_models` it is already there
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.llm_interface import OllamaInterface
+from src.config import parallel_requests_from_env
+from src.llm_interface import OllamaInterface, CONNECT_TIMEOUT
+
+# orjson is optional; it serializes the raw results faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Number of questions sent to the model at once by a bare --parallel, unless
+# Ollama's OLLAMA_NUM_PARALLEL says how many requests it runs at once
+MAX_PARALLEL_QUESTIONS = 4
+
+# System prompt sent with every test question
+SYSTEM_PROMPT = "You are Viktor from the animated series Arcane. Respond as this character would."
+
+# How long Ollama keeps the model loaded after each request, the warm-up included
+KEEP_ALIVE = "30m"
+
+# Part of every run signature; bump it when a change to this script changes the
+# results, so runs made before the change are no longer considered up to date
+RESULTS_VERSION = 1
 
 class Config:
     """Simple configuration class for model settings."""
-    def __init__(self, model_name, temperature=0.7, max_tokens=500):
+    def __init__(self, model_name, temperature=0.7, max_tokens=500, keep_alive=KEEP_ALIVE):
         self.model_name = model_name
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.keep_alive = keep_alive
 
 def load_character_data():
     """Mock function to load character data."""
@@ -38,22 +65,20 @@ def load_character_data():
         "background": "Viktor is from the undercity of Zaun and works with Jayce in Piltover."
     }
 
+@functools.lru_cache(maxsize=1)
 def get_available_models():
-    """Get a list of available models from Ollama."""
+    """Get the models available in Ollama, asking the server only once per process."""
     try:
         response = requests.get("http://localhost:11434/api/tags")
         if response.status_code == 200:
-            models = [model["name"] for model in response.json()["models"]]
+            models = tuple(model["name"] for model in response.json()["models"])
             return models
         else:
             print(f"Error getting models from Ollama: {response.status_code}")
-            return []
+            return ()
     except Exception as e:
         print(f"Error connecting to Ollama: {e}")
-        return []
-
-# Get available models
-AVAILABLE_MODELS = get_available_models()
+        return ()
 
 # Default test questions from the model_test_questions.txt file or custom questions
 DEFAULT_TEST_QUESTIONS = [
@@ -78,6 +103,54 @@ def load_test_questions(file_path=None):
         print("Using default questions instead.")
         return DEFAULT_TEST_QUESTIONS
 
+def _sha256(text):
+    """Hash a string, to tell whether it changed without storing it."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def run_signature(questions_file, temperature, max_tokens, parallel):
+    """
+    Describe the inputs of a test run: the questions file, prompts and settings.
+    
+    The questions file is identified by its modification time and size, so it
+    does not have to be read to tell whether it changed. The system prompt and
+    character data are identified by their hashes.
+    
+    Returns:
+        Dictionary describing the run, or None if the questions file cannot be found
+    """
+    if not questions_file:
+        return None
+    try:
+        stat = os.stat(questions_file)
+    except OSError:
+        return None
+    return {
+        "questions_file": str(questions_file),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "system_prompt_sha256": _sha256(SYSTEM_PROMPT),
+        "character_data_sha256": _sha256(json.dumps(load_character_data(), sort_keys=True)),
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        # Concurrent runs time their responses differently
+        "parallel": parallel,
+        "results_version": RESULTS_VERSION
+    }
+
+def results_up_to_date(signature_file, latest_file, signature):
+    """Check whether the latest results were produced by a run with the given signature."""
+    if signature is None or not latest_file.exists():
+        return False
+    try:
+        with open(signature_file, 'r', encoding='utf-8') as f:
+            previous_signature = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return (
+        previous_signature == signature
+        and latest_file.stat().st_mtime_ns >= signature["mtime_ns"]
+    )
+
 def create_results_directory(model_name, output_dir="model_test_results", use_mock=False):
     """
     Create a directory for storing test results.
@@ -110,11 +183,6 @@ def create_results_directory(model_name, output_dir="model_test_results", use_mo
     
     return model_dir
 
-def format_duration(seconds):
-    """Format duration in seconds to a readable string."""
-    minutes, seconds = divmod(seconds, 60)
-    return f"{int(minutes)}m {int(seconds)}s"
-
 def initialize_model(model_name, temperature=0.7, max_tokens=500, use_mock=False):
     """Initialize the model for testing."""
     if use_mock:
@@ -128,9 +196,63 @@ def generate_response(model, question, character_data, use_mock=False):
     if use_mock:
         return f"This is a mock response to: {question}"
     else:
-        # Create a system prompt from character data
-        system_prompt = "You are Viktor from the animated series Arcane. Respond as this character would."
-        return model.generate(question, system_prompt)
+        return model.generate(question, SYSTEM_PROMPT)
+
+def warm_up_model(model_name):
+    """
+    Load the model into Ollama and process SYSTEM_PROMPT before the timed questions are sent.
+    
+    The warm-up request carries the same SYSTEM_PROMPT as every question and
+    generates a single token, so the first question's response time includes
+    neither loading the model nor processing the system prompt, which Ollama
+    reuses from its prompt cache. Like every question, it is sent with
+    KEEP_ALIVE, which keeps the model loaded for the rest of the run.
+    
+    Args:
+        model_name: Name of the Ollama model to load
+    """
+    try:
+        response = requests.post(
+            "http://localhost:11434/api/generate",
+            json={
+                "model": model_name,
+                "system": SYSTEM_PROMPT,
+                "prompt": "Hello.",
+                "options": {"num_predict": 1},
+                "keep_alive": KEEP_ALIVE,
+                "stream": False
+            },
+            # Loading a large model can take minutes, so only connecting is time-limited
+            timeout=(CONNECT_TIMEOUT, None)
+        )
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"Warning: Could not warm up model {model_name}: {e}")
+
+def timed_generate_response(model, question, character_data, use_mock=False):
+    """
+    Generate a response and measure how long it took.
+    
+    Responses from Ollama are streamed, so the time until the first piece of
+    the response arrived is measured as well.
+    
+    Returns:
+        Tuple of (response, duration in seconds, time to first token in
+        seconds or None for the mock model)
+    """
+    start_time = time.perf_counter()
+    if use_mock:
+        response = generate_response(model, question, character_data, use_mock)
+        return response, time.perf_counter() - start_time, None
+    
+    pieces = []
+    first_token_time = None
+    for piece in model.generate_stream(question, SYSTEM_PROMPT):
+        if first_token_time is None:
+            first_token_time = time.perf_counter() - start_time
+        pieces.append(piece)
+    end_time = time.perf_counter()
+    return "".join(pieces), end_time - start_time, first_token_time
 
 class MockModel:
     """Mock model for testing without using a real LLM."""
@@ -143,170 +265,6 @@ class MockModel:
         """Generate a mock response."""
         return f"This is a mock response from {self.model_name} to: {prompt}"
 
-def test_model(model_name, questions, temperature=0.7, max_tokens=500):
-    """Test a single model with the provided questions."""
-    print(f"\n{'='*50}")
-    print(f"Testing model: {model_name}")
-    print(f"{'='*50}")
-    
-    # Initialize configuration and ViktorAI
-    config = Config(
-        model_name=model_name,
-        temperature=temperature,
-        max_tokens=max_tokens
-    )
-    
-    try:
-        viktor_ai = OllamaInterface(config)
-    except Exception as e:
-        print(f"Error initializing ViktorAI with model {model_name}: {e}")
-        return None
-    
-    results = []
-    total_time = 0
-    
-    for i, question in enumerate(questions, 1):
-        print(f"\nQuestion {i}/{len(questions)}: {question}")
-        
-        # Measure response time
-        start_time = time.time()
-        try:
-            response = viktor_ai.generate_response(question)
-            end_time = time.time()
-            duration = end_time - start_time
-            total_time += duration
-            
-            print(f"Response received in {format_duration(duration)}")
-            print(f"Viktor: {response[:100]}..." if len(response) > 100 else f"Viktor: {response}")
-            
-            results.append({
-                "question": question,
-                "response": response,
-                "duration": duration
-            })
-        except Exception as e:
-            print(f"Error generating response: {e}")
-            results.append({
-                "question": question,
-                "response": f"ERROR: {str(e)}",
-                "duration": 0
-            })
-    
-    avg_time = total_time / len(questions) if questions else 0
-    print(f"\nTesting completed for {model_name}")
-    print(f"Average response time: {format_duration(avg_time)}")
-    
-    return {
-        "model": model_name,
-        "temperature": temperature,
-        "max_tokens": max_tokens,
-        "results": results,
-        "avg_response_time": avg_time,
-        "total_time": total_time,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    }
-
-def save_results_to_markdown(results, results_dir):
-    """Save test results to a timestamped markdown file in the model's directory."""
-    if not results:
-        return None
-    
-    model_name = results["model"]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Extract just the last part of the model name for the filename
-    model_filename = model_name.split('/')[-1]
-    file_path = results_dir / f"{model_filename}_test_{timestamp}.md"
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(f"# {model_name.upper()} Test Results\n\n")
-        f.write(f"**Test Date:** {results['timestamp']}\n")
-        f.write(f"**Temperature:** {results['temperature']}\n")
-        f.write(f"**Max Tokens:** {results['max_tokens']}\n")
-        f.write(f"**Average Response Time:** {format_duration(results['avg_response_time'])}\n")
-        f.write(f"**Total Test Duration:** {format_duration(results['total_time'])}\n\n")
-        
-        f.write("## Test Questions and Responses\n\n")
-        
-        for i, result in enumerate(results["results"], 1):
-            f.write(f"### Question {i}: {result['question']}\n\n")
-            f.write(f"**Response Time:** {format_duration(result['duration'])}\n\n")
-            
-            # Clean the response by removing any prefixes and code blocks
-            response = result['response']
-            
-            # Remove "[Viktor's response as AI]:" prefix if present
-            if "[Viktor's response as AI]:" in response:
-                response = response.replace("[Viktor's response as AI]:", "").strip()
-            
-            # Remove code block markers if present
-            if "```vbnet" in response:
-                response = response.replace("```vbnet", "").strip()
-            if "```" in response:
-                response = response.replace("```", "").strip()
-            
-            f.write(f"**Viktor's Response:**\n\n{response}\n\n")
-            f.write("---\n\n")
-    
-    print(f"Results saved to {file_path}")
-    
-    # Also create/update a latest results file
-    model_filename = model_name.split('/')[-1]
-    latest_file_path = results_dir / f"{model_filename}_latest.md"
-    with open(latest_file_path, 'w', encoding='utf-8') as f:
-        f.write(f"# {model_name.upper()} Latest Test Results\n\n")
-        f.write(f"**Test Date:** {results['timestamp']}\n")
-        f.write(f"**Temperature:** {results['temperature']}\n")
-        f.write(f"**Max Tokens:** {results['max_tokens']}\n")
-        f.write(f"**Average Response Time:** {format_duration(results['avg_response_time'])}\n")
-        f.write(f"**Total Test Duration:** {format_duration(results['total_time'])}\n\n")
-        
-        f.write("## Test Questions and Responses\n\n")
-        
-        for i, result in enumerate(results["results"], 1):
-            f.write(f"### Question {i}: {result['question']}\n\n")
-            f.write(f"**Response Time:** {format_duration(result['duration'])}\n\n")
-            
-            # Clean the response by removing any prefixes and code blocks
-            response = result['response']
-            
-            # Remove "[Viktor's response as AI]:" prefix if present
-            if "[Viktor's response as AI]:" in response:
-                response = response.replace("[Viktor's response as AI]:", "").strip()
-            
-            # Remove code block markers if present
-            if "```vbnet" in response:
-                response = response.replace("```vbnet", "").strip()
-            if "```" in response:
-                response = response.replace("```", "").strip()
-            
-            f.write(f"**Viktor's Response:**\n\n{response}\n\n")
-            f.write("---\n\n")
-    
-    print(f"Latest results also saved to {latest_file_path}")
-    
-    return file_path
-
-def update_model_history(model_name, results, results_dir):
-    """Update the model history file with a summary of this test run."""
-    # Extract just the last part of the model name for the filename
-    model_filename = model_name.split('/')[-1]
-    history_file = results_dir / f"{model_filename}_history.md"
-    
-    # Create the history file if it doesn't exist
-    if not history_file.exists():
-        with open(history_file, 'w', encoding='utf-8') as f:
-            f.write(f"# {model_name.upper()} Test History\n\n")
-            f.write("| Date | Temperature | Max Tokens | Avg Response Time | Total Duration |\n")
-            f.write("|------|-------------|------------|-------------------|----------------|\n")
-    
-    # Append the new test results to the history file
-    with open(history_file, 'a', encoding='utf-8') as f:
-        f.write(f"| {results['timestamp']} | {results['temperature']} | {results['max_tokens']} | ")
-        f.write(f"{format_duration(results['avg_response_time'])} | {format_duration(results['total_time'])} |\n")
-    
-    print(f"Test history updated at {history_file}")
-
 def parse_arguments():
     """Parse command-line arguments for the model testing script."""
     parser = argparse.ArgumentParser(description="Test ViktorAI models with different prompts")
@@ -332,6 +290,14 @@ def parse_arguments():
     parser.add_argument("--use-mock", action="store_true",
                         help="Use mock implementations instead of real LLM (for testing)")
     
+    parallel = parallel_requests_from_env(MAX_PARALLEL_QUESTIONS)
+    parser.add_argument("--parallel", type=int, nargs="?", default=1, const=parallel,
+                        help=f"Maximum number of questions sent to the model at once (default: 1, or {parallel} "
+                             "when given without a number); response times then include time spent waiting for the model")
+    
+    parser.add_argument("--force", action="store_true",
+                        help="Run the tests even if the questions and settings are unchanged since the last run")
+    
     parser.add_argument("--list-models", action="store_true",
                         help="List available models and exit")
     
@@ -361,14 +327,25 @@ def main():
         print("Continuing with --use-mock=True to avoid errors.")
         args.use_mock = True
     
-    # Load test questions
-    questions = load_test_questions(args.questions_file)
-    print(f"Loaded {len(questions)} test questions")
-    
     # Create results directory
     results_dir = create_results_directory(args.model, args.output_dir, args.use_mock)
     print(f"Created results directory: {results_dir}")
     
+    # Skip the run if the latest results already cover these questions and settings
+    latest_file = results_dir / f"{args.model}_latest.md"
+    signature_file = results_dir / f"{args.model}_latest.sig"
+    signature = run_signature(args.questions_file, args.temperature, args.max_tokens, max(1, args.parallel))
+    if not args.force and results_up_to_date(signature_file, latest_file, signature):
+        print(f"Results in {latest_file} are up to date, skipping (use --force to run anyway)")
+        return 0
+    
+    # The latest results are about to change, so forget what the previous run covered
+    signature_file.unlink(missing_ok=True)
+    
+    # Load test questions
+    questions = load_test_questions(args.questions_file)
+    print(f"Loaded {len(questions)} test questions")
+    
     # Load character data
     character_data = load_character_data()
     print(f"Loaded {len(character_data)} character data files")
@@ -378,46 +355,87 @@ def main():
         model = initialize_model(args.model, args.temperature, args.max_tokens, args.use_mock)
         print(f"Initialized model: {args.model}")
         
+        if not args.use_mock:
+            warm_up_model(args.model)
+        
         # Test the model with each question
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         results_file = results_dir / f"{args.model}_test_{timestamp}.md"
-        latest_file = results_dir / f"{args.model}_latest.md"
+        raw_results_file = results_dir / f"{args.model}_test_{timestamp}.jsonl"
         history_file = results_dir / f"{args.model}_history.md"
         
-        with open(results_file, "w", encoding="utf-8") as f:
+        # Send the questions to the model, concurrently if asked to, then write the responses in order
+        max_workers = max(1, min(args.parallel, len(questions)))
+        # Concurrent questions share the model, so label their timings as such
+        timing_label = f" (concurrent, up to {max_workers} at once)" if max_workers > 1 else ""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                open(results_file, "w", encoding="utf-8") as f, \
+                open(raw_results_file, "wb") as raw_f:
+            futures = [
+                executor.submit(timed_generate_response, model, question, character_data, args.use_mock)
+                for question in questions
+            ]
+            
             f.write(f"# Model Test Results: {args.model}\n\n")
             f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            if max_workers > 1:
+                f.write(f"**Questions Sent at Once:** up to {max_workers}\n\n")
             
-            for i, question in enumerate(questions):
+            for i, (question, future) in enumerate(zip(questions, futures)):
                 print(f"\nTesting question {i+1}/{len(questions)}: {question}")
                 
-                # Generate response
-                start_time = time.time()
-                response = generate_response(model, question, character_data, args.use_mock)
-                end_time = time.time()
+                # Wait for the response
+                response, response_time, first_token_time = future.result()
+                print(f"Response received in {response_time:.2f} seconds{timing_label}")
                 
-                response_time = end_time - start_time
-                print(f"Response received in {response_time:.2f} seconds")
+                first_token_line = ""
+                if first_token_time is not None:
+                    print(f"First token received after {first_token_time:.2f} seconds{timing_label}")
+                    first_token_line = f"**Time to First Token:** {first_token_time:.2f} seconds{timing_label}\n\n"
                 
                 # Write results to file
-                f.write(f"## Question {i+1}: {question}\n\n")
-                f.write(f"**Response Time:** {response_time:.2f} seconds\n\n")
-                f.write("**Response:**\n\n")
-                f.write(f"{response}\n\n")
-                f.write("---\n\n")
+                f.write(
+                    f"## Question {i+1}: {question}\n\n"
+                    f"**Response Time:** {response_time:.2f} seconds{timing_label}\n\n"
+                    f"{first_token_line}"
+                    f"**Response:**\n\n{response}\n\n"
+                    "---\n\n"
+                )
+                
+                # Keep the raw result as one JSON line for later analysis
+                raw_result = {
+                    "question": question,
+                    "response": response,
+                    "duration": response_time,
+                    "first_token_time": first_token_time,
+                    "parallel": max_workers
+                }
+                raw_line = orjson.dumps(raw_result) if orjson is not None else json.dumps(raw_result).encode("utf-8")
+                raw_f.write(raw_line + b"\n")
         
         print(f"\nResults saved to {results_file}")
+        print(f"Raw results saved to {raw_results_file}")
         
-        # Copy to latest file
-        shutil.copy(results_file, latest_file)
+        # Point the latest file at this run's results: a hard link copies no data,
+        # and the old link is removed first so earlier runs' files are left alone
+        latest_file.unlink(missing_ok=True)
+        try:
+            os.link(results_file, latest_file)
+        except OSError:
+            shutil.copy(results_file, latest_file)
         print(f"Latest results saved to {latest_file}")
         
         # Update history file
         with open(history_file, "a", encoding="utf-8") as f:
-            f.write(f"- [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test run with {len(questions)} questions - [Results]({results_file.name})\n")
+            f.write(f"- [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test run with {len(questions)} questions{timing_label} - [Results]({results_file.name})\n")
         
         print(f"Test history updated in {history_file}")
         
+        # Record what this run covered so an identical rerun can be skipped
+        if signature is not None:
+            with open(signature_file, "w", encoding="utf-8") as f:
+                json.dump(signature, f)
+        
     except Exception as e:
         print(f"Error testing model: {e}")
         import traceback
@@ -6,14 +6,15 @@ This module contains tests for the response quality classifier, including
 model initialization, feature extraction, and training functionality.
 """
 
+import io
 import os
 import sys
 import json
 import unittest
-import tempfile
-from pathlib import Path
+from unittest import mock
 import torch
 import numpy as np
+from torch.nn.utils import parameters_to_vector
 
 # Add parent directory to path so we can import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -29,16 +30,48 @@ from src.response_classifier import (
 class TestResponseClassifier(unittest.TestCase):
     """Test cases for the response classifier."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Build the classifiers shared by every test."""
+        # The tensors here are tiny, so extra intra-op threads only add overhead
+        cls.previous_num_threads = torch.get_num_threads()
+        torch.set_num_threads(1)
+
         # Use a test configuration
-        self.config = Config(
+        cls.config = Config(
             use_response_classifier=True, min_response_score=0.6, debug=True
         )
 
-        # Create a temporary directory for test models
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.temp_model_path = Path(self.temp_dir.name) / "test_model.pt"
+        # Building a classifier is the slowest part of these tests, so build
+        # two once: one for tests to modify, and a fresh one to compare against.
+        # They only need the CPU, so keep them from picking (and initializing) a GPU
+        with mock.patch("torch.cuda.is_available", return_value=False):
+            cls.shared_classifier = ResponseClassifier(cls.config)
+            cls.shared_fresh_classifier = ResponseClassifier(cls.config)
+
+        # Snapshot the initial weights so each test starts from the same state
+        cls.initial_state = {
+            name: tensor.clone()
+            for name, tensor in cls.shared_classifier.model.state_dict().items()
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the torch settings changed for these tests."""
+        torch.set_num_threads(cls.previous_num_threads)
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Seed the random number generators so training runs are reproducible
+        torch.manual_seed(0)
+        np.random.seed(0)
+
+        # Reset the shared classifiers to their initial weights and evaluation mode
+        for classifier in (self.shared_classifier, self.shared_fresh_classifier):
+            classifier.model.load_state_dict(self.initial_state)
+            classifier.model.eval()
+        self.classifier = self.shared_classifier
+        self.fresh_classifier = self.shared_fresh_classifier
 
         # Sample training data
         self.training_data = [
@@ -68,13 +101,9 @@ class TestResponseClassifier(unittest.TestCase):
             },
         ]
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
-
     def test_model_initialization(self):
         """Test that the model initializes correctly."""
-        classifier = ResponseClassifier(self.config)
+        classifier = self.classifier
 
         # Check that the model is a PyTorch module
         self.assertIsInstance(classifier.model, torch.nn.Module)
@@ -90,7 +119,7 @@ class TestResponseClassifier(unittest.TestCase):
 
     def test_feature_extraction(self):
         """Test feature extraction from prompts and responses."""
-        classifier = ResponseClassifier(self.config)
+        classifier = self.classifier
 
         # Test with a Viktor-relevant prompt and response
         prompt = "Tell me about your work with the Hexcore."
@@ -118,13 +147,19 @@ class TestResponseClassifier(unittest.TestCase):
 
     def test_response_evaluation(self):
         """Test that responses are properly evaluated."""
-        classifier = ResponseClassifier(self.config)
+        classifier = self.classifier
 
         # Test a good, in-character response
         prompt = "Tell me about the Hexcore."
         good_response = "The Hexcore is my greatest achievement - a fusion of hextech and organic material that evolves beyond its programming. Despite Jayce's reservations, I've continued my research, even as my condition deteriorates. It represents our future."
 
-        scores = classifier.evaluate_response(prompt, good_response)
+        # Test an out-of-character response
+        bad_response = "I love parties and dancing all night! Hextech is boring compared to having fun!"
+
+        # Evaluate both responses in one batch
+        scores, scores_bad = classifier.evaluate_batch(
+            [prompt, prompt], [good_response, bad_response]
+        )
 
         # Check that the scores are produced correctly
         self.assertIn("character_accuracy", scores)
@@ -137,10 +172,11 @@ class TestResponseClassifier(unittest.TestCase):
         self.assertGreaterEqual(scores["response_quality"], 0.0)
         self.assertLessEqual(scores["response_quality"], 1.0)
 
-        # Test an out-of-character response
-        bad_response = "I love parties and dancing all night! Hextech is boring compared to having fun!"
-
-        scores_bad = classifier.evaluate_response(prompt, bad_response)
+        # Batched scores should match scoring each response on its own
+        for batch_scores, response in ((scores, good_response), (scores_bad, bad_response)):
+            single_scores = classifier.evaluate_response(prompt, response)
+            for key, value in single_scores.items():
+                self.assertAlmostEqual(batch_scores[key], value, places=5)
 
         # Bad response should score lower than good response
         # Note: With a fresh model this might not always be true, but after training it should be
@@ -150,7 +186,7 @@ class TestResponseClassifier(unittest.TestCase):
 
     def test_model_training(self):
         """Test the model training functionality."""
-        classifier = ResponseClassifier(self.config)
+        classifier = self.classifier
 
         # Save initial predictions for comparison
         test_prompt = "What do you think about Heimerdinger?"
@@ -162,17 +198,19 @@ class TestResponseClassifier(unittest.TestCase):
         train_model(
             classifier=classifier,
             training_data=self.training_data,
-            epochs=50,  # Smaller number for testing
+            epochs=2,  # Only checking that training runs, not how well
             learning_rate=0.01,
         )
 
-        # Save the model to our temp location
-        torch.save(classifier.model.state_dict(), self.temp_model_path)
+        # Save the model to an in-memory buffer
+        buffer = io.BytesIO()
+        torch.save(classifier.model.state_dict(), buffer)
 
-        # Create a new classifier and load the trained model
-        new_classifier = ResponseClassifier(self.config)
+        # Load the trained model into a fresh classifier
+        new_classifier = self.fresh_classifier
+        buffer.seek(0)
         new_classifier.model.load_state_dict(
-            torch.load(self.temp_model_path, map_location=new_classifier.device)
+            torch.load(buffer, map_location="cpu")
         )
 
         # Get post-training predictions
@@ -190,8 +228,8 @@ class TestResponseClassifier(unittest.TestCase):
 
     def test_model_save_load(self):
         """Test saving and loading the model."""
-        # Initialize a classifier and modify weights to ensure they're different from default
-        classifier = ResponseClassifier(self.config)
+        # Take a classifier and modify weights to ensure they're different from default
+        classifier = self.classifier
 
         # Change some weights to non-default values
         with torch.no_grad():
@@ -199,32 +237,35 @@ class TestResponseClassifier(unittest.TestCase):
                 # Add 0.1 to all weights
                 param.add_(0.1)
 
-        # Save the model
-        torch.save(classifier.model.state_dict(), self.temp_model_path)
+        # Save the model to an in-memory buffer
+        buffer = io.BytesIO()
+        torch.save(classifier.model.state_dict(), buffer)
 
-        # Create a new classifier with default weights
-        new_classifier = ResponseClassifier(self.config)
+        # Take a fresh classifier with default weights
+        new_classifier = self.fresh_classifier
 
         # Weights should be different before loading
-        for p1, p2 in zip(
-            classifier.model.parameters(), new_classifier.model.parameters()
-        ):
-            # If any parameter differs significantly, the test passes
-            if torch.max(torch.abs(p1 - p2)) > 0.05:
-                break
-        else:
-            self.fail("Models should have different weights before loading")
+        saved_weights = parameters_to_vector(classifier.model.parameters())
+        self.assertGreater(
+            (saved_weights - parameters_to_vector(new_classifier.model.parameters()))
+            .abs()
+            .max(),
+            0.05,
+            "Models should have different weights before loading",
+        )
 
         # Load the saved model
+        buffer.seek(0)
         new_classifier.model.load_state_dict(
-            torch.load(self.temp_model_path, map_location=new_classifier.device)
+            torch.load(buffer, map_location="cpu")
         )
 
-        # Now weights should be the same
-        for p1, p2 in zip(
-            classifier.model.parameters(), new_classifier.model.parameters()
-        ):
-            self.assertTrue(torch.allclose(p1, p2, atol=1e-6))
+        # Now weights should be exactly the same, since saving and loading is lossless
+        saved_state = classifier.model.state_dict()
+        loaded_state = new_classifier.model.state_dict()
+        self.assertEqual(saved_state.keys(), loaded_state.keys())
+        for name, tensor in saved_state.items():
+            self.assertTrue(torch.equal(tensor, loaded_state[name]), name)
 
 
 if __name__ == "__main__":